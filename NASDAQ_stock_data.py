@@ -3,6 +3,9 @@ import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any
+
+from ohlcv_io import write_csv, write_parquet
+from yfinance_cache import cache_path, is_intraday, load_cached_frame, store_cached_frame
 
 def get_us_stock_ohlcv(
     ticker: str,
@@ -28,23 +31,27 @@ def get_us_stock_ohlcv(
     print(f"Fetching data for {ticker}...")
     
     try:
+        if start_date and end_date:
+            cache_file = cache_path(ticker, interval, start=start_date, end=end_date)
+        else:
+            cache_file = cache_path(ticker, interval, period=period)
+        cached = load_cached_frame(cache_file, interval)
+        if cached is not None:
+            return cached
+
+        # Ticker.history returns single-level columns, unlike the batch download path.
+        history = yf.Ticker(ticker).history
         # If start_date and end_date are provided, use them
         if start_date and end_date:
-            data = yf.download(ticker, start=start_date, end=end_date, interval=interval, progress=False)
+            data = history(start=start_date, end=end_date, interval=interval)
         else:
             # Otherwise use period
-            data = yf.download(ticker, period=period, interval=interval, progress=False)
+            data = history(period=period, interval=interval)
 
         if data.empty:
             print(f"No data found for {ticker}.")
             return pd.DataFrame()
 
-        # yfinance returns a MultiIndex columns if multiple tickers, but here we ask for one.
-        # However, sometimes it returns columns like ('Close', 'AAPL').
-        # We flatten/clean the columns just in case.
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = data.columns.get_level_values(0)
-
         # Ensure standard columns
         data = data.rename(columns={
             "Open": "open",
@@ -62,7 +69,11 @@ def get_us_stock_ohlcv(
         # Reset index to make Date a column if needed, or keep it as index.
         # For now, let's keep it as index but ensure it's datetime.
         data.index = pd.to_datetime(data.index)
-        
+        # Match yf.download: daily+ bars are stored as naive exchange-local dates.
+        if data.index.tz is not None and not is_intraday(interval):
+            data.index = data.index.tz_localize(None)
+
+        store_cached_frame(cache_file, data)
         return data
 
     except Exception as e:
@@ -84,5 +95,6 @@ if __name__ == "__main__":
         export_df = two_year_df.copy()
         export_df.index.name = "date"
         export_df = export_df.reset_index()
-        export_df.to_csv(output_path, index=False)
+        write_csv(export_df, output_path)
+        write_parquet(export_df, output_path)
         print(f"Saved {len(export_df)} rows to {output_path}")
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
+from ohlcv_io import write_csv, write_parquet
+from yfinance_cache import cache_path, load_cached_frame, store_cached_frame
+
 
 DEFAULT_PERIOD = "59d"  # yfinance limit for 5m data (~60d)
 DEFAULT_INTERVAL = "5m"
 EXPORT_PATH = Path(__file__).with_name("nasdaq_data") / "AAPL_CVD.csv"
+CVD_DIR = Path(__file__).with_name("nasdaq_data") / "cvd"
+CVD_CANDLE_COLUMNS = ["date", "open", "high", "low", "close"]
 
 
 @dataclass
@@ -26,11 +32,14 @@ class Candle:
 
 def fetch_intraday_data(ticker: str) -> pd.DataFrame:
     """Download 5-minute OHLCV data for the requested ticker."""
-    df = yf.download(ticker, period=DEFAULT_PERIOD, interval=DEFAULT_INTERVAL, progress=False)
+    cache_file = cache_path(ticker, DEFAULT_INTERVAL, period=DEFAULT_PERIOD)
+    cached = load_cached_frame(cache_file, DEFAULT_INTERVAL)
+    if cached is not None:
+        return cached
+
+    df = yf.Ticker(ticker).history(period=DEFAULT_PERIOD, interval=DEFAULT_INTERVAL)
     if df.empty:
         raise ValueError(f"{ticker} 5분 데이터를 가져오지 못했습니다.")
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
     df = df.rename(columns={
         "Open": "open",
         "High": "high",
@@ -38,43 +47,36 @@ def fetch_intraday_data(ticker: str) -> pd.DataFrame:
         "Close": "close",
         "Volume": "volume",
     })
-    return df[["open", "high", "low", "close", "volume"]]
+    df = df[["open", "high", "low", "close", "volume"]]
+    store_cached_frame(cache_file, df)
+    return df
 
 
 def compute_daily_cvd(df: pd.DataFrame) -> pd.DataFrame:
     """Transform 5m bars into daily CVD candles."""
     if df.empty:
         raise ValueError("입력된 데이터가 비어 있습니다.")
-    delta = df.apply(_calc_delta_per_row, axis=1)
-    df = df.copy()
-    df["delta"] = delta
-    df["date"] = df.index.date
-
-    records = []
-    for date_value, group in df.groupby("date"):
-        cumsum = group["delta"].cumsum()
-        high = max(0, cumsum.max())
-        low = min(0, cumsum.min())
-        close = cumsum.iloc[-1]
-        records.append(
-            {
-                "date": pd.Timestamp(date_value),
-                "open": 0.0,
-                "high": float(high),
-                "low": float(low),
-                "close": float(close),
-            }
-        )
-
-    return pd.DataFrame(records)
-
-
-def _calc_delta_per_row(row: pd.Series) -> float:
-    if row["close"] > row["open"]:
-        return float(row["volume"])
-    if row["close"] < row["open"]:
-        return -float(row["volume"])
-    return 0.0
+    # 양봉이면 +volume, 음봉이면 -volume, 보합이면 0 (행 단위 apply 대신 한 번에 계산)
+    diff = df["close"].to_numpy(dtype=np.float64) - df["open"].to_numpy(dtype=np.float64)
+    volume = df["volume"].to_numpy(dtype=np.float64)
+    delta = np.where(diff > 0, volume, np.where(diff < 0, -volume, 0.0))
+
+    # 거래소 현지 시각 기준 날짜(int64 키)로 묶는다. datetime.date 객체 배열을 만들지 않는다.
+    local_index = df.index.tz_localize(None) if df.index.tz is not None else df.index
+    day_key = local_index.floor("D")
+    cvd = pd.Series(delta, index=df.index).groupby(day_key).cumsum()
+
+    # 일봉 CVD: 시가는 0에서 시작하고, 고가/저가는 0을 경계로 포함한다.
+    daily = (
+        cvd.groupby(day_key)
+        .agg(high="max", low="min", close="last")
+        .rename_axis("date")
+        .reset_index()
+    )
+    daily["high"] = daily["high"].clip(lower=0.0)
+    daily["low"] = daily["low"].clip(upper=0.0)
+    daily.insert(1, "open", 0.0)
+    return daily
 
 
 def export_cvd_csv(ticker: str, output_path: Optional[Path] = None) -> Path:
@@ -83,75 +85,59 @@ def export_cvd_csv(ticker: str, output_path: Optional[Path] = None) -> Path:
     if output_path is None:
         output_path = EXPORT_PATH
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    cvd_df.to_csv(output_path, index=False)
+    write_csv(cvd_df, output_path)
+    write_parquet(cvd_df, output_path)
     print(f"{ticker} CVD {len(cvd_df)}행 저장 완료: {output_path}")
     return output_path
 
 
-if __name__ == "__main__":
-    try:
-        export_cvd_csv("AAPL")
-    except Exception as exc:
-        print(f"에러: {exc}")
-
-
-"""
-import pandas as pd
-from pathlib import Path
-from typing import List, Dict, Any, Optional
-
-CVD_DIR = Path(__file__).parent / "nasdaq_data" / "cvd"
-
 def get_daily_cvd_candles(ticker: str) -> List[Dict[str, Any]]:
     """
     Reads Daily CVD candles from a pre-calculated CSV file.
     Path: nasdaq_data/cvd/{ticker}_CVD.csv
-    
+
     Expected CSV columns: date, open, high, low, close
     """
     csv_path = CVD_DIR / f"{ticker}_CVD.csv"
-    
+
     if not csv_path.exists():
-        # print(f"CVD file not found for {ticker}: {csv_path}")
         return []
 
     try:
-        df = pd.read_csv(csv_path)
-        
-        # Ensure columns exist
-        required = {"date", "open", "high", "low", "close"}
-        if not required.issubset(df.columns):
-            print(f"Invalid columns in {csv_path}: {df.columns}")
-            return []
-            
-        # Parse date
-        df["date"] = pd.to_datetime(df["date"])
-        
-        cvd_candles = []
-        for _, row in df.iterrows():
-            date_val = row["date"]
-            candle = {
-                "time": {
-                    "year": date_val.year,
-                    "month": date_val.month,
-                    "day": date_val.day,
-                },
-                "open": float(row["open"]),
-                "high": float(row["high"]),
-                "low": float(row["low"]),
-                "close": float(row["close"])
-            }
-            cvd_candles.append(candle)
-            
-        return cvd_candles
-
+        # Only parse the candle columns, with explicit dtypes (no inference pass)
+        df = pd.read_csv(
+            csv_path,
+            usecols=CVD_CANDLE_COLUMNS,
+            dtype={"open": "float64", "high": "float64", "low": "float64", "close": "float64"},
+            parse_dates=["date"],
+        )
+    except ValueError as e:
+        # usecols raises when a required column is missing
+        print(f"Invalid columns in {csv_path}: {e}")
+        return []
     except Exception as e:
         print(f"Error reading CVD CSV for {ticker}: {e}")
         return []
 
+    return [
+        {
+            "time": {
+                "year": row.date.year,
+                "month": row.date.month,
+                "day": row.date.day,
+            },
+            "open": row.open,
+            "high": row.high,
+            "low": row.low,
+            "close": row.close,
+        }
+        for row in df.itertuples(index=False)
+    ]
+
+
 if __name__ == "__main__":
-    # Test
-    res = get_daily_cvd_candles("AAPL")
-    print(f"Loaded {len(res)} CVD candles for AAPL")
-    if res:
-        print(res[-1])
+    try:
+        export_cvd_csv("AAPL")
+    except Exception as exc:
+        print(f"에러: {exc}")
+
@@ -12,16 +12,27 @@ Example:
 from __future__ import annotations
 
 import argparse
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable, List, Sequence
 
 import ccxt  # type: ignore
+import numpy as np
 import pandas as pd
 
+try:
+    import ccxt.async_support as ccxt_async  # type: ignore
+except ImportError:  # pragma: no cover - older ccxt builds ship without it
+    ccxt_async = None
+
+from ohlcv_io import write_csv, write_parquet
+
 REPO_ROOT = Path(__file__).resolve().parent
 DATA_DIR = REPO_ROOT / "stock_data"
+BATCH_LIMIT = 1000
+MAX_CONCURRENT_REQUESTS = 4
 
 
 @dataclass
@@ -58,18 +69,22 @@ def _instantiate_exchange(exchange_id: str) -> ccxt.Exchange:
     return exchange
 
 
-def fetch_ohlcv_rows(cfg: FetchConfig) -> List[Sequence[float]]:
-    exchange = _instantiate_exchange(cfg.exchange_id)
-    since_ms = int(
+def _history_start_ms(cfg: FetchConfig) -> int:
+    return int(
         (datetime.now(timezone.utc) - timedelta(days=cfg.days)).timestamp() * 1000
     )
+
+
+def _fetch_ohlcv_rows_sync(cfg: FetchConfig) -> List[Sequence[float]]:
+    exchange = _instantiate_exchange(cfg.exchange_id)
+    since_ms = _history_start_ms(cfg)
     timeframe_ms = int(exchange.parse_timeframe(cfg.timeframe) * 1000)
     rows: List[Sequence[float]] = []
     now_ms = exchange.milliseconds()
 
     while since_ms < now_ms:
         batch = exchange.fetch_ohlcv(
-            cfg.symbol, cfg.timeframe, since_ms, limit=1000
+            cfg.symbol, cfg.timeframe, since_ms, limit=BATCH_LIMIT
         )
         if not batch:
             break
@@ -85,27 +100,92 @@ def fetch_ohlcv_rows(cfg: FetchConfig) -> List[Sequence[float]]:
     return rows
 
 
+async def _fetch_ohlcv_rows_async(cfg: FetchConfig) -> List[Sequence[float]]:
+    exchange_cls = getattr(ccxt_async, cfg.exchange_id.lower())
+    exchange = exchange_cls({"enableRateLimit": True})
+    try:
+        if not exchange.has.get("fetchOHLCV"):
+            raise ValueError(f"Exchange '{cfg.exchange_id}' does not support fetchOHLCV")
+        timeframe_ms = int(exchange.parse_timeframe(cfg.timeframe) * 1000)
+        window_ms = BATCH_LIMIT * timeframe_ms
+        now_ms = exchange.milliseconds()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_window(start_ms: int) -> List[Sequence[float]]:
+            # Exchanges may cap ``limit`` below BATCH_LIMIT, so keep paging
+            # until this window is covered.
+            end_ms = start_ms + window_ms
+            window_rows: List[Sequence[float]] = []
+            since_ms = start_ms
+            async with semaphore:
+                while since_ms < min(end_ms, now_ms):
+                    batch = await exchange.fetch_ohlcv(
+                        cfg.symbol, cfg.timeframe, since_ms, limit=BATCH_LIMIT
+                    )
+                    if not batch:
+                        break
+                    window_rows.extend(row for row in batch if row[0] < end_ms)
+                    next_since = batch[-1][0] + timeframe_ms
+                    if next_since <= since_ms:
+                        break
+                    since_ms = next_since
+            return window_rows
+
+        starts = range(_history_start_ms(cfg), now_ms, window_ms)
+        batches = await asyncio.gather(*(fetch_window(start) for start in starts))
+    finally:
+        await exchange.close()
+
+    rows = [row for batch in batches for row in batch]
+    rows.sort(key=lambda row: row[0])
+    return rows
+
+
+def fetch_ohlcv_rows(cfg: FetchConfig) -> List[Sequence[float]]:
+    """Backfill OHLCV rows, fetching time windows concurrently when possible.
+
+    The history is split into ``BATCH_LIMIT``-candle windows which are
+    requested in parallel (bounded by ``MAX_CONCURRENT_REQUESTS``; ccxt's
+    rate limiter still applies). Exchanges missing from ``ccxt.async_support``
+    use the sequential paging loop instead.
+    """
+    if ccxt_async is None or not hasattr(ccxt_async, cfg.exchange_id.lower()):
+        return _fetch_ohlcv_rows_sync(cfg)
+    return asyncio.run(_fetch_ohlcv_rows_async(cfg))
+
+
 def _format_dataframe(rows: Iterable[Sequence[float]]) -> pd.DataFrame:
-    columns = ["timestamp", "open", "high", "low", "close", "volume"]
-    frame = pd.DataFrame(rows, columns=columns)
-    if frame.empty:
-        return frame
-    frame["date"] = (
-        pd.to_datetime(frame["timestamp"], unit="ms", utc=True)
-        .dt.tz_convert("UTC")
-        .dt.tz_localize(None)
-    )
-    cleaned = (
-        frame.drop(columns=["timestamp"])
-        .dropna(subset=["open", "high", "low", "close"])
-        .sort_values("date")
-        .drop_duplicates(subset="date", keep="last")
-    )
-    numeric_cols = ["open", "high", "low", "close", "volume"]
-    cleaned[numeric_cols] = cleaned[numeric_cols].apply(
-        pd.to_numeric, errors="coerce"
-    )
-    return cleaned[["date", "open", "high", "low", "close", "volume"]]
+    columns = ["date", "open", "high", "low", "close", "volume"]
+    rows = list(rows)
+    if not rows:
+        return pd.DataFrame(columns=columns)
+    # ccxt structure: [timestamp(ms), open, high, low, close, volume]
+    timestamps = np.asarray([row[0] for row in rows], dtype=np.int64)
+    numeric_rows = [row[1:6] for row in rows]
+    try:
+        values = np.asarray(numeric_rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Some exchanges hand back strings; coerce those cell by cell.
+        values = (
+            pd.DataFrame(numeric_rows)
+            .apply(pd.to_numeric, errors="coerce")
+            .to_numpy(dtype=np.float64)
+        )
+    # Drop rows missing any of open/high/low/close (volume may be empty).
+    valid = ~np.isnan(values[:, :4]).any(axis=1)
+    timestamps = timestamps[valid]
+    values = values[valid]
+    # ccxt already pages in ascending order; only sort when it did not.
+    if (np.diff(timestamps) < 0).any():
+        order = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+        values = values[order]
+    # Duplicates only show up at page boundaries; keep the last fetched row.
+    keep = np.ones(timestamps.shape[0], dtype=bool)
+    keep[:-1] = timestamps[:-1] != timestamps[1:]
+    frame = pd.DataFrame(values[keep], columns=columns[1:])
+    frame.insert(0, "date", pd.to_datetime(timestamps[keep], unit="ms"))
+    return frame
 
 
 def run(cfg: FetchConfig) -> Path:
@@ -114,7 +194,8 @@ def run(cfg: FetchConfig) -> Path:
     if frame.empty:
         raise RuntimeError("No OHLCV rows fetched; check the symbol/timeframe combination.")
     output_path = cfg.resolved_output_path()
-    frame.to_csv(output_path, index=False)
+    write_csv(frame, output_path)
+    write_parquet(frame, output_path)
     return output_path
 
 
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["aligned_values"]
+
+
+def aligned_values(
+    first: pd.Series, second: pd.Series
+) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Return float64 arrays of the rows where both series are present.
+
+    Equivalent to ``pd.concat({...}, axis=1).dropna()``, but series cut from
+    the same OHLCV frame share one index, so that case only needs a NaN mask
+    (and no allocation at all when nothing is missing).
+    """
+
+    if first.index.equals(second.index):
+        first_arr = first.to_numpy(dtype=np.float64)
+        second_arr = second.to_numpy(dtype=np.float64)
+        mask = ~(np.isnan(first_arr) | np.isnan(second_arr))
+        if mask.all():
+            return first_arr, second_arr, first.index
+        return first_arr[mask], second_arr[mask], first.index[mask]
+
+    joint = pd.concat({"first": first, "second": second}, axis=1).dropna()
+    return (
+        joint["first"].to_numpy(dtype=np.float64),
+        joint["second"].to_numpy(dtype=np.float64),
+        joint.index,
+    )
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+from indicator.rsi import RSI_PERIOD, _wilder_step
+
+__all__ = ["HAS_JIT", "rsi_obv", "warm_up"]
+
+
+def _rsi_obv_loop(
+    close: np.ndarray, volume: np.ndarray, period: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    # RSI는 ``indicator.rsi._rsi_loop``와 같은 단계 함수를 쓰고, OBV는
+    # ``indicator.obv._obv_loop``와 같다. 한 번의 순회로 두 지표를 같이 채운다.
+    n = close.shape[0]
+    rsi = np.zeros(n, dtype=np.float64)
+    obv = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return rsi, obv
+    obv[0] = 0.0
+    alpha = 1.0 / period
+    avg_gain = np.nan
+    avg_loss = np.nan
+    old_wt = 1.0
+    nobs = 0
+    for idx in range(1, n):
+        delta = close[idx] - close[idx - 1]
+
+        if delta > 0.0:
+            obv[idx] = obv[idx - 1] + volume[idx]
+        elif delta < 0.0:
+            obv[idx] = obv[idx - 1] - volume[idx]
+        else:
+            obv[idx] = obv[idx - 1]
+
+        rsi[idx], avg_gain, avg_loss, old_wt, nobs = _wilder_step(
+            delta, avg_gain, avg_loss, old_wt, nobs, alpha, period
+        )
+    return rsi, obv
+
+
+_rsi_obv_kernel = njit(cache=True)(_rsi_obv_loop) if njit is not None else None
+
+HAS_JIT = _rsi_obv_kernel is not None
+
+
+def rsi_obv(
+    close: np.ndarray, volume: np.ndarray, period: int = RSI_PERIOD
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute RSI and OBV over NaN-free float64 arrays in one fused pass.
+
+    값은 ``compute_rsi``/``compute_obv``와 같다. 결측이 있는 입력은 행 정렬이
+    필요하므로 호출하는 쪽에서 기존 pandas 경로를 써야 한다. numba가 없으면
+    같은 루프를 파이썬으로 돌리므로 ``HAS_JIT``를 먼저 확인한다.
+    """
+
+    if period <= 0:
+        raise ValueError("period must be a positive integer.")
+    kernel = _rsi_obv_kernel if _rsi_obv_kernel is not None else _rsi_obv_loop
+    return kernel(close, volume, period)
+
+
+def warm_up() -> None:
+    """Compile the fused kernel up front so the first request skips JIT cost."""
+
+    if _rsi_obv_kernel is None:
+        return
+    dummy = np.linspace(1.0, 2.0, 32)
+    _rsi_obv_kernel(dummy, dummy, RSI_PERIOD)
@@ -1,5 +1,11 @@
+import numpy as np
 import pandas as pd
 
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - numexpr is an optional accelerator
+    ne = None
+
 def compute_ad(data: pd.DataFrame) -> pd.Series:
     """
     Compute Accumulation/Distribution (A/D) Line.
@@ -12,18 +18,44 @@ def compute_ad(data: pd.DataFrame) -> pd.Series:
     if data.empty:
         return pd.Series(dtype=float)
 
-    high = data["high"]
-    low = data["low"]
-    close = data["close"]
-    volume = data["volume"]
+    ad = ad_line_values(
+        data["high"].to_numpy(dtype=np.float64),
+        data["low"].to_numpy(dtype=np.float64),
+        data["close"].to_numpy(dtype=np.float64),
+        data["volume"].to_numpy(dtype=np.float64),
+    )
+    return pd.Series(ad, index=data.index)
+
 
+def ad_line_values(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> np.ndarray:
+    """A/D line over float64 arrays, for callers that already hold the columns."""
     # Calculate CLV (Close Location Value)
-    # Handle division by zero where High == Low
+    # (Close - Low) - (High - Close) == 2 * Close - High - Low
+    # Division is skipped where High == Low so CLV stays 0
     range_hl = high - low
-    clv = ((close - low) - (high - close)) / range_hl
-    clv = clv.fillna(0.0)  # Replace NaN (0/0) with 0
-    
+    if ne is not None:
+        # numexpr evaluates the whole expression in one blocked pass
+        clv = ne.evaluate(
+            "where(range_hl != 0, (2 * close - high - low) / range_hl, 0.0)"
+        )
+    else:
+        clv = np.zeros_like(range_hl)
+        np.divide(2 * close - high - low, range_hl, out=clv, where=range_hl != 0)
+    # A missing high/low/close leaves CLV as NaN; like ``clv.fillna(0.0)`` count it as 0
+    clv_missing = np.isnan(clv)
+    if clv_missing.any():
+        clv[clv_missing] = 0.0
+
     # Calculate A/D
-    ad = (clv * volume).cumsum()
-    
+    flow = clv * volume
+    flow_missing = np.isnan(flow)
+    if not flow_missing.any():
+        return np.cumsum(flow)
+    # Match pandas' skipna cumsum: a missing volume leaves that row NaN
+    # without poisoning every later value
+    flow[flow_missing] = 0.0
+    ad = np.cumsum(flow)
+    ad[flow_missing] = np.nan
     return ad
@@ -10,8 +10,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - bottleneck is an optional accelerator
+    bn = None
+
+from indicator._align import aligned_values
+
 __all__ = [
     "CLOUD_BULLISH_COLOR",
     "CLOUD_BEARISH_COLOR",
@@ -22,6 +30,8 @@ __all__ = [
 
 CLOUD_BULLISH_COLOR = "#089981"
 CLOUD_BEARISH_COLOR = "#f23645"
+# 색상은 두 가지뿐이므로 category(int8 코드 + 2개짜리 사전)로 보관한다.
+_CLOUD_COLOR_CATEGORIES = [CLOUD_BEARISH_COLOR, CLOUD_BULLISH_COLOR]
 
 
 @dataclass(frozen=True)
@@ -35,9 +45,21 @@ class IchimokuCloud:
     color: pd.Series
 
 
-def _rolling_midpoint(high: pd.Series, low: pd.Series, window: int) -> pd.Series:
-    highest = high.rolling(window).max()
-    lowest = low.rolling(window).min()
+def _empty_cloud() -> IchimokuCloud:
+    empty = pd.Series(dtype="float64")
+    color = pd.Series(pd.Categorical([], categories=_CLOUD_COLOR_CATEGORIES))
+    return IchimokuCloud(empty, empty, empty, empty, color)
+
+
+def _rolling_midpoint(high: np.ndarray, low: np.ndarray, window: int) -> np.ndarray:
+    if window > high.shape[0]:
+        return np.full(high.shape[0], np.nan)
+    if bn is not None:
+        highest = bn.move_max(high, window, min_count=window)
+        lowest = bn.move_min(low, window, min_count=window)
+    else:
+        highest = pd.Series(high).rolling(window).max().to_numpy()
+        lowest = pd.Series(low).rolling(window).min().to_numpy()
     return (highest + lowest) / 2
 
 
@@ -65,28 +87,32 @@ def compute_ichimoku_cloud(
     """
 
     if high.empty or low.empty:
-        empty = pd.Series(dtype="float64")
-        color = pd.Series(dtype="object")
-        return IchimokuCloud(empty, empty, empty, empty, color)
+        return _empty_cloud()
 
-    joint = pd.concat({"high": high, "low": low}, axis=1).dropna()
-    if joint.empty:
-        empty = pd.Series(dtype="float64")
-        color = pd.Series(dtype="object")
-        return IchimokuCloud(empty, empty, empty, empty, color)
+    high_arr, low_arr, index = aligned_values(high, low)
+    if not len(index):
+        return _empty_cloud()
 
-    conversion_line = _rolling_midpoint(joint["high"], joint["low"], conversion_period)
-    base_line = _rolling_midpoint(joint["high"], joint["low"], base_period)
+    conversion_line = _rolling_midpoint(high_arr, low_arr, conversion_period)
+    base_line = _rolling_midpoint(high_arr, low_arr, base_period)
 
-    span_a = ((conversion_line + base_line) / 2).shift(displacement)
+    span_a = pd.Series((conversion_line + base_line) / 2, index=index)
+    span_a = span_a.shift(displacement)
 
-    span_b = _rolling_midpoint(joint["high"], joint["low"], span_b_period)
+    span_b = pd.Series(
+        _rolling_midpoint(high_arr, low_arr, span_b_period), index=index
+    )
     span_b = span_b.shift(displacement)
 
-    top = span_a.combine(span_b, max)
-    bottom = span_a.combine(span_b, min)
-    color = pd.Series(CLOUD_BEARISH_COLOR, index=span_a.index)
-    color = color.where(span_a < span_b, CLOUD_BULLISH_COLOR)
+    span_a_arr = span_a.to_numpy()
+    span_b_arr = span_b.to_numpy()
+    top = pd.Series(np.maximum(span_a_arr, span_b_arr), index=span_a.index)
+    bottom = pd.Series(np.minimum(span_a_arr, span_b_arr), index=span_a.index)
+    is_bullish = (~(span_a_arr < span_b_arr)).astype(np.int8)
+    color = pd.Series(
+        pd.Categorical.from_codes(is_bullish, categories=_CLOUD_COLOR_CATEGORIES),
+        index=span_a.index,
+    )
 
     valid = ~(span_a.isna() | span_b.isna())
     span_a = span_a[valid]
@@ -1,8 +1,25 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-__all__ = ["compute_obv"]
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+from indicator._align import aligned_values
+
+__all__ = ["compute_obv", "compute_obv_nb"]
+
+
+def _obv_values(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    # TradingView-style OBV starts at 0 and accumulates thereafter.
+    direction = np.sign(np.diff(close))
+    obv = np.empty_like(volume)
+    obv[0] = 0.0
+    np.cumsum(direction * volume[1:], out=obv[1:])
+    return obv
 
 
 def compute_obv(close: pd.Series, volume: pd.Series) -> pd.Series:
@@ -14,31 +31,55 @@ def compute_obv(close: pd.Series, volume: pd.Series) -> pd.Series:
 
     Returns:
         Pandas Series containing the OBV values aligned with the
-        overlapping index of ``close`` and ``volume``.
+        overlapping index of ``close`` and ``volume``. When both come from
+        the same frame and have no missing values, that is the frame's own
+        index, so callers need no reindex.
     """
 
     if close.empty or volume.empty:
         return pd.Series(dtype="float64")
 
-    data = pd.concat({"close": close, "volume": volume}, axis=1).dropna()
-    if data.empty:
+    close_arr, volume_arr, index = aligned_values(close, volume)
+    if not len(index):
         return pd.Series(dtype="float64")
 
-    # TradingView-style OBV starts at 0 and accumulates thereafter.
-    obv = pd.Series(index=data.index, dtype="float64")
-    obv.iloc[0] = 0.0
-
-    for idx in range(1, len(data)):
-        prev_obv = obv.iloc[idx - 1]
-        curr_close = data["close"].iloc[idx]
-        prev_close = data["close"].iloc[idx - 1]
-        curr_volume = float(data["volume"].iloc[idx])
-
-        if curr_close > prev_close:
-            obv.iloc[idx] = prev_obv + curr_volume
-        elif curr_close < prev_close:
-            obv.iloc[idx] = prev_obv - curr_volume
+    return pd.Series(_obv_values(close_arr, volume_arr), index=index)
+
+
+def _obv_loop(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    out = np.empty(close.shape[0], dtype=np.float64)
+    if close.shape[0] == 0:
+        return out
+    out[0] = 0.0
+    for idx in range(1, close.shape[0]):
+        if close[idx] > close[idx - 1]:
+            out[idx] = out[idx - 1] + volume[idx]
+        elif close[idx] < close[idx - 1]:
+            out[idx] = out[idx - 1] - volume[idx]
         else:
-            obv.iloc[idx] = prev_obv
+            out[idx] = out[idx - 1]
+    return out
 
-    return obv
+
+_obv_kernel = njit(cache=True, fastmath=True)(_obv_loop) if njit is not None else None
+
+
+def compute_obv_nb(close: pd.Series, volume: pd.Series) -> pd.Series:
+    """Numba-compiled OBV for tick-by-tick tail updates.
+
+    ``compute_obv``와 동일한 값을 돌려주지만, 짧은 구간을 반복 호출하는
+    스트리밍 갱신에서는 JIT 커널의 호출 비용이 훨씬 작다. numba가 설치되어
+    있지 않으면 ``compute_obv``로 그대로 위임한다.
+    """
+
+    if _obv_kernel is None:
+        return compute_obv(close, volume)
+
+    if close.empty or volume.empty:
+        return pd.Series(dtype="float64")
+
+    close_arr, volume_arr, index = aligned_values(close, volume)
+    if not len(index):
+        return pd.Series(dtype="float64")
+
+    return pd.Series(_obv_kernel(close_arr, volume_arr), index=index)
@@ -1,13 +1,110 @@
 from __future__ import annotations
 
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
 RSI_PERIOD = 14
 RSI_COLOR = "#ffffff"
 
 __all__ = ["compute_rsi", "RSI_PERIOD", "RSI_COLOR"]
 
 
+def _wilder_average(values: np.ndarray, period: int) -> np.ndarray:
+    # Wilder's smoothing (EMA with alpha = 1/period)
+    return (
+        pd.Series(values)
+        .ewm(alpha=1 / period, adjust=False, min_periods=period)
+        .mean()
+        .to_numpy()
+    )
+
+
+def _rsi_values(close: np.ndarray, period: int) -> np.ndarray:
+    # Price change from previous close
+    delta = np.empty_like(close)
+    delta[0] = np.nan
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+    gains = np.clip(delta, 0.0, None)
+    losses = -np.clip(delta, None, 0.0)
+
+    avg_gain = _wilder_average(gains, period)
+    avg_loss = _wilder_average(losses, period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
+        rsi = 100 - (100 / (1 + rs))
+
+    return np.where(np.isnan(rsi), 0.0, rsi)
+
+
+def _wilder_step(
+    delta: float,
+    avg_gain: float,
+    avg_loss: float,
+    old_wt: float,
+    nobs: int,
+    alpha: float,
+    period: int,
+) -> Tuple[float, float, float, float, int]:
+    # One bar of both Wilder averages, following pandas'
+    # ``ewm(adjust=False, min_periods=period)`` recurrence seeded by the first
+    # valid change. Returns (rsi, avg_gain, avg_loss, old_wt, nobs); the RSI
+    # is 0 until ``period`` changes have been seen.
+    is_obs = not np.isnan(delta)
+    gain = 0.0
+    loss = 0.0
+    if is_obs:
+        nobs += 1
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
+    if not np.isnan(avg_gain):
+        old_wt *= 1.0 - alpha
+        if is_obs:
+            if avg_gain != gain:
+                avg_gain = (old_wt * avg_gain + alpha * gain) / (old_wt + alpha)
+            if avg_loss != loss:
+                avg_loss = (old_wt * avg_loss + alpha * loss) / (old_wt + alpha)
+            old_wt = 1.0
+    elif is_obs:
+        avg_gain = gain
+        avg_loss = loss
+    rsi = 0.0
+    if nobs >= period and avg_loss != 0.0:
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return rsi, avg_gain, avg_loss, old_wt, nobs
+
+
+# Compiled once and shared by ``_rsi_loop`` and the fused kernel in ``indicator._jit``
+if njit is not None:
+    _wilder_step = njit(cache=True)(_wilder_step)
+
+
+def _rsi_loop(close: np.ndarray, period: int) -> np.ndarray:
+    # Single sweep equivalent to ``_rsi_values``, so the JIT path returns identical values.
+    n = close.shape[0]
+    out = np.zeros(n, dtype=np.float64)
+    alpha = 1.0 / period
+    avg_gain = np.nan
+    avg_loss = np.nan
+    old_wt = 1.0
+    nobs = 0
+    for idx in range(1, n):
+        out[idx], avg_gain, avg_loss, old_wt, nobs = _wilder_step(
+            close[idx] - close[idx - 1], avg_gain, avg_loss, old_wt, nobs, alpha, period
+        )
+    return out
+
+
+_rsi_kernel = njit(cache=True)(_rsi_loop) if njit is not None else None
+
+
 def compute_rsi(close: pd.Series, period: int = RSI_PERIOD) -> pd.Series:
     """
     Compute the Relative Strength Index (RSI) for the provided closing prices.
@@ -25,16 +122,9 @@ def compute_rsi(close: pd.Series, period: int = RSI_PERIOD) -> pd.Series:
     if close.empty:
         return pd.Series(dtype="float64")
 
-    # Price change from previous close
-    delta = close.diff()
-    gains = delta.clip(lower=0)
-    losses = -delta.clip(upper=0)
-
-    # Wilder's smoothing (EMA with alpha = 1/period)
-    avg_gain = gains.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
-    avg_loss = losses.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
-
-    rs = avg_gain / avg_loss.replace(0, float("nan"))
-    rsi = 100 - (100 / (1 + rs))
-
-    return rsi.fillna(0.0)
+    close_arr = close.to_numpy(dtype=np.float64)
+    if _rsi_kernel is not None:
+        rsi = _rsi_kernel(close_arr, period)
+    else:
+        rsi = _rsi_values(close_arr, period)
+    return pd.Series(rsi, index=close.index)
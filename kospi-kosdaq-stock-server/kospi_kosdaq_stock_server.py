@@ -1,19 +1,36 @@
+import asyncio
+import calendar
 import csv
+import hashlib
+import io
 import json
 import logging
-from datetime import datetime
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, Union, Optional
+from typing import Dict, Any, Union, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from mcp.server.fastmcp import FastMCP
 from pykrx.stock.stock_api import get_market_ohlcv, get_nearest_business_day_in_a_week, get_market_cap, \
     get_market_fundamental_by_date, get_market_trading_volume_by_date, get_market_trading_volume_by_investor, \
     get_previous_business_days, get_index_ohlcv_by_date
 from pykrx.website.krx.market.wrap import get_market_ticker_and_name
-import ccxt
-import yfinance as yf
+from pykrx.website.comm import webio as krx_webio
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
 
 try:
     from stock_update import StockDataUpdater
@@ -34,6 +51,8 @@ mcp = FastMCP(
 
 # Global variable to store ticker information in memory
 TICKER_MAP: Dict[str, str] = {}
+# Serialized TICKER_MAP for the stock://tickers resource (rebuilt on load)
+_TICKER_MAP_JSON: Optional[str] = None
 
 # Directory for exporting investor trading volume snapshots
 TRADING_VOLUME_EXPORT_DIR = Path.cwd() / "trading_volume_exports"
@@ -43,10 +62,118 @@ TRADING_VOLUME_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 INVESTOR_DAILY_EXPORT_DIR = TRADING_VOLUME_EXPORT_DIR / "daily_investor"
 INVESTOR_DAILY_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Write buffer for streamed CSV exports
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Process-wide worker pool for blocking pykrx/yfinance/ccxt calls
+# (bounded to stay polite to KRX and the exchanges)
+IO_MAX_WORKERS = 8
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="io")
+
+
+async def _run_io(func, *args, **kwargs):
+    """Runs a blocking call on ``_IO_EXECUTOR`` so it never stalls the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_EXECUTOR, partial(func, *args, **kwargs))
+
+# Process-wide HTTP session so repeated calls reuse keep-alive/TLS connections
+HTTP_POOL_SIZE = 16
+SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+SESSION.mount("https://", _HTTP_ADAPTER)
+SESSION.mount("http://", _HTTP_ADAPTER)
+
+# pykrx 1.0.x의 webio는 요청마다 requests.get/post를 직접 호출하므로 공유 세션으로 돌린다.
+# (로그인 세션을 자체 관리하는 최신 pykrx는 그대로 둔다)
+if not hasattr(krx_webio, "get_session"):
+    krx_webio.requests = SESSION
+
+# ccxt(수백 개 거래소 클래스)와 yfinance는 import 비용이 커서 첫 사용 시점에 로드한다
+_ccxt = None
+_yf = None
+
+
+def _get_ccxt():
+    global _ccxt
+    if _ccxt is None:
+        import ccxt as _ccxt_mod
+        _ccxt = _ccxt_mod
+    return _ccxt
+
+
+def _get_yf():
+    global _yf
+    if _yf is None:
+        import yfinance as _yf_mod
+        _yf = _yf_mod
+    return _yf
+
+
+# Bybit client is built once (markets table, rate limiter, HTTP session) and reused
+_BYBIT = None
+_BYBIT_LOCK = threading.Lock()
+
+
+def _get_bybit():
+    global _BYBIT
+    if _BYBIT is None:
+        with _BYBIT_LOCK:
+            if _BYBIT is None:
+                _BYBIT = _get_ccxt().bybit({'enableRateLimit': True, 'session': SESSION})
+    return _BYBIT
+
+
+# Bybit returns at most this many candles per fetch_ohlcv request
+BYBIT_MAX_CANDLES_PER_REQUEST = 1000
+
+
+def _fetch_bybit_ohlcv(exchange, symbol: str, timeframe: str, limit: int) -> list:
+    """Fetches the latest ``limit`` candles, paging forward with ``since`` past the per-request cap."""
+    if limit <= BYBIT_MAX_CANDLES_PER_REQUEST:
+        return exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+
+    # 가장 오래된 봉 시점부터 시작해 마지막 봉 다음 시점으로 since를 옮겨 가며 받는다
+    timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+    since = exchange.milliseconds() - limit * timeframe_ms
+    rows = []
+    while len(rows) < limit:
+        batch = exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=BYBIT_MAX_CANDLES_PER_REQUEST)
+        if not batch:
+            break
+        rows.extend(batch)
+        since = batch[-1][0] + 1
+        if len(batch) < BYBIT_MAX_CANDLES_PER_REQUEST:
+            break
+        if not exchange.enableRateLimit:
+            # enableRateLimit 클라이언트는 ccxt가 알아서 요청 간격을 둔다
+            time.sleep(exchange.rateLimit / 1000)
+    return rows[-limit:]
+
+
 # Directory where the main FastAPI app loads OHLCV CSV datasets from
 STOCK_DATA_EXPORT_DIR = (Path(__file__).resolve().parent.parent / "stock_data").resolve()
 STOCK_DATA_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Bybit fetches up to this many rows are written without building a DataFrame
+BYBIT_DIRECT_WRITE_MAX_ROWS = 5000
+
+
+def _csv_price(value: Any) -> str:
+    """Formats a ccxt OHLCV value the way DataFrame.to_csv writes a float64 column."""
+    # 결측(None/NaN)은 빈 칸, 정수도 float로 (42000 -> 42000.0)
+    if value is None or value != value:
+        return ''
+    return repr(float(value))
+
+
+def _blank_missing(values: list) -> list:
+    """Replaces NaN with '' so csv.writer matches DataFrame.to_csv's empty fields."""
+    return ['' if value != value else value for value in values]
+
 # Directory for exporting crypto data
 CRYPTO_DATA_EXPORT_DIR = (Path(__file__).resolve().parent.parent / "crypto_data").resolve()
 CRYPTO_DATA_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
@@ -55,8 +182,218 @@ CRYPTO_DATA_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 NASDAQ_DATA_EXPORT_DIR = (Path(__file__).resolve().parent.parent / "nasdaq_data").resolve()
 NASDAQ_DATA_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Directory for on-disk ticker name snapshots (one file per business day)
+TICKER_CACHE_DIR = STOCK_DATA_EXPORT_DIR / "_cache"
+
+
+def _ticker_cache_path(business_day: str) -> Path:
+    return TICKER_CACHE_DIR / f"tickers_{business_day}.feather"
+
+
+# Accepted date inputs: YYYYMMDD or YYYY-MM-DD (month/day may omit the zero padding,
+# as strptime('%Y-%m-%d') allowed, e.g. 2024-1-5)
+# (re.ASCII: \d must not match fullwidth or other Unicode digits, which strptime rejected)
+_YYYYMMDD = re.compile(r'(\d{4})(\d{2})(\d{2})', re.ASCII)
+_YYYY_MM_DD = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})', re.ASCII)
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _validate_date(date_str: Union[str, int]) -> str:
+    """Normalizes a YYYYMMDD / YYYY-MM-DD date into YYYYMMDD."""
+    if not isinstance(date_str, str):
+        date_str = str(date_str)
+    # A dash tells the two accepted formats apart (2024-1-5 is also 8 characters long)
+    compact = '-' not in date_str
+    match = (_YYYYMMDD if compact else _YYYY_MM_DD).fullmatch(date_str)
+    if match is not None:
+        year, month, day = match.groups()
+        y, m, d = int(year), int(month), int(day)
+        if (
+            1900 <= y <= 2100
+            and 1 <= m <= 12
+            and 1 <= d <= _DAYS_IN_MONTH[m - 1]
+            and (m != 2 or d < 29 or calendar.isleap(y))
+        ):
+            return date_str if compact else f"{y:04d}{m:02d}{d:02d}"
+    raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
+
+
+def _validate_ticker(ticker_str: Union[str, int]) -> str:
+    """Normalizes a ticker given as str or int into a str."""
+    return str(ticker_str)
+
+
+# Index OHLCV frequencies: d - daily / m - monthly / y - yearly
+_VALID_FREQS = frozenset({'d', 'm', 'y'})
+
+
+def _validate_freq(freq_str: str) -> str:
+    if freq_str not in _VALID_FREQS:
+        raise ValueError(f"Frequency must be one of {sorted(_VALID_FREQS)}. Input value: {freq_str}")
+    return freq_str
+
+
+_INVESTOR_VOLUME_COLUMNS = ["매도", "매수", "순매수"]
+
+
+def _investor_volumes(table: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns (n, 3) int64 sell/buy/net volumes and a mask of complete rows.
+
+    KRX가 빠뜨린 컬럼은 0으로 채우고, 값이 비어 있는 행은 mask에서 제외한다.
+    """
+    block = table.reindex(columns=_INVESTOR_VOLUME_COLUMNS, fill_value=0)
+    if all(pd.api.types.is_integer_dtype(dtype) for dtype in block.dtypes):
+        volumes = block.to_numpy(dtype=np.int64)
+        return volumes, np.ones(len(volumes), dtype=bool)
+    values = block.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    valid = np.isfinite(values).all(axis=1)
+    return np.where(valid[:, None], values, 0).astype(np.int64), valid
+
+
+# pykrx 한글 컬럼명 -> ETHUSDT 포맷 컬럼명
+_OHLCV_COLUMN_ALIASES = {
+    "시가": "open",
+    "고가": "high",
+    "저가": "low",
+    "종가": "close",
+    "거래량": "volume",
+}
+
+
+def _normalize_ohlcv_column(column: Any) -> str:
+    name = str(column).strip().lower()
+    return _OHLCV_COLUMN_ALIASES.get(name, name)
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame (index, values and column labels)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _newest_first_rows(df: pd.DataFrame) -> Tuple[list, list]:
+    """Returns ([YYYY-MM-DD, ...], [row dict, ...]) for a date-indexed DataFrame, newest first."""
+    # pykrx/yfinance already return ascending dates, so a reversed view is enough
+    if df.index.is_monotonic_increasing:
+        df = df.iloc[::-1]
+    else:
+        df = df.sort_index(ascending=False)
+    dates = df.index.strftime('%Y-%m-%d').tolist()
+    columns = df.columns.tolist()
+    # 컬럼 단위로 한 번에 파이썬 값으로 꺼낸 뒤 행 dict로 묶는다 (to_dict(orient='index')보다 가볍다)
+    rows = zip(*(_column_values(df.iloc[:, position]) for position in range(len(columns))))
+    return dates, [dict(zip(columns, row)) for row in rows]
+
+
+def _df_to_sorted_dict(df: pd.DataFrame) -> Dict[str, Any]:
+    """Converts a date-indexed DataFrame into {YYYY-MM-DD: row} ordered newest first."""
+    dates, rows = _newest_first_rows(df)
+    return dict(zip(dates, rows))
+
+
+def _df_to_compact(df: pd.DataFrame) -> Dict[str, Any]:
+    """Converts a date-indexed DataFrame into {'dates': [...], 'rows': [...]} ordered newest first."""
+    dates, rows = _newest_first_rows(df)
+    return {"dates": dates, "rows": rows}
+
+
+def _column_values(series: pd.Series) -> list:
+    if isinstance(series.dtype, np.dtype):
+        return series.tolist()
+    # nullable 확장 dtype은 pd.NA 대신 None을 돌려준다 (to_dict와 동일)
+    return [None if pd.isna(value) else value for value in series.tolist()]
+
+
+# KRX 조회 결과 메모이제이션 (같은 구간 재요청 시 네트워크 생략)
+# 오늘(또는 이후)을 포함한 구간은 장중에 당일 봉이 계속 바뀌므로 캐시하지 않고,
+# todate가 오늘 이전인 닫힌 구간만 캐시한다.
+# 반환된 DataFrame은 캐시와 공유되므로 호출 측에서 수정하지 않는다.
+KRX_CACHE_SIZE = 256
+
+
+def _today_key() -> str:
+    return datetime.now().strftime('%Y%m%d')
+
+
+def _is_closed_range(todate: str) -> bool:
+    """True when ``todate`` (YYYYMMDD) is before today, so KRX will not revise the range."""
+    return todate < _today_key()
+
+
+@lru_cache(maxsize=KRX_CACHE_SIZE)
+def _cached_market_ohlcv(fromdate: str, todate: str, ticker: str, adjusted: bool) -> pd.DataFrame:
+    return get_market_ohlcv(fromdate, todate, ticker, adjusted=adjusted)
+
+
+@lru_cache(maxsize=KRX_CACHE_SIZE)
+def _cached_market_cap(fromdate: str, todate: str, ticker: str) -> pd.DataFrame:
+    return get_market_cap(fromdate, todate, ticker)
+
+
+@lru_cache(maxsize=KRX_CACHE_SIZE)
+def _cached_market_fundamental(fromdate: str, todate: str, ticker: str) -> pd.DataFrame:
+    return get_market_fundamental_by_date(fromdate, todate, ticker)
+
+
+def _market_ohlcv(fromdate: str, todate: str, ticker: str, adjusted: bool) -> pd.DataFrame:
+    if _is_closed_range(todate):
+        return _cached_market_ohlcv(fromdate, todate, ticker, adjusted)
+    return get_market_ohlcv(fromdate, todate, ticker, adjusted=adjusted)
+
+
+def _market_cap(fromdate: str, todate: str, ticker: str) -> pd.DataFrame:
+    if _is_closed_range(todate):
+        return _cached_market_cap(fromdate, todate, ticker)
+    return get_market_cap(fromdate, todate, ticker)
+
+
+def _market_fundamental(fromdate: str, todate: str, ticker: str) -> pd.DataFrame:
+    if _is_closed_range(todate):
+        return _cached_market_fundamental(fromdate, todate, ticker)
+    return get_market_fundamental_by_date(fromdate, todate, ticker)
+
+
+@lru_cache(maxsize=KRX_CACHE_SIZE)
+def _cached_index_ohlcv_rows(fromdate: str, todate: str, ticker: str, freq: str) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    """Formatted index rows for a closed range (todate before today), which never change."""
+    df = get_index_ohlcv_by_date(fromdate, todate, ticker, freq=freq, name_display=False)
+    return tuple(_df_to_sorted_dict(df).items())
+
+
+@lru_cache(maxsize=4)
+def _business_day_for(today: str) -> str:
+    """Nearest KRX business day, probed once per calendar day."""
+    return get_nearest_business_day_in_a_week()
+
+
+_KRX_CACHES = (
+    _cached_market_ohlcv,
+    _cached_market_cap,
+    _cached_market_fundamental,
+    _cached_index_ohlcv_rows,
+    _business_day_for,
+)
+
+def _write_ticker_cache(merged: pd.Series, cache_path: Path) -> None:
+    TICKER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (
+        merged
+        .rename_axis("ticker")
+        .reset_index(name="name")
+        .to_feather(cache_path)
+    )
+
+
 @mcp.tool()
-def load_all_tickers() -> Dict[str, str]:
+async def load_all_tickers() -> Dict[str, str]:
     """Loads all ticker symbols and names for KOSPI and KOSDAQ into memory.
 
     Returns:
@@ -64,29 +401,50 @@ def load_all_tickers() -> Dict[str, str]:
         Example: {"005930": "삼성전자", "035720": "카카오", ...}
     """
     try:
-        global TICKER_MAP
+        global TICKER_MAP, _TICKER_MAP_JSON
 
         # If TICKER_MAP already has data, return it
         if TICKER_MAP:
-            logging.debug(f"Returning cached ticker information with {len(TICKER_MAP)} stocks")
+            logging.debug("Returning cached ticker information with %d stocks", len(TICKER_MAP))
             return TICKER_MAP
 
         logging.debug("No cached data found. Loading KOSPI/KOSDAQ ticker symbols")
 
         # Retrieve data based on today's date
-        today = get_nearest_business_day_in_a_week()
-        logging.debug(f"Reference date: {today}")
+        today = await _run_io(_business_day_for, _today_key())
+        logging.debug("Reference date: %s", today)
+
+        # Reuse today's snapshot from disk instead of hitting KRX again
+        cache_path = _ticker_cache_path(today)
+        if cache_path.exists():
+            try:
+                cached = await _run_io(pd.read_feather, cache_path)
+                TICKER_MAP.update(zip(cached["ticker"], cached["name"]))
+                _TICKER_MAP_JSON = _json_dumps(TICKER_MAP)
+                logging.debug("Loaded %d tickers from %s", len(TICKER_MAP), cache_path)
+                return TICKER_MAP
+            except Exception as cache_error:
+                logging.warning("Ignoring unreadable ticker cache (%s): %s", cache_path, cache_error)
 
         # get_market_ticker_and_name() returns a Series,
-        # where the index is the ticker and the values are the stock names
-        kospi_series = get_market_ticker_and_name(today, market="KOSPI")
-        kosdaq_series = get_market_ticker_and_name(today, market="KOSDAQ")
+        # where the index is the ticker and the values are the stock names.
+        # The two markets are independent requests, so fetch them concurrently.
+        kospi_series, kosdaq_series = await asyncio.gather(
+            _run_io(get_market_ticker_and_name, today, market="KOSPI"),
+            _run_io(get_market_ticker_and_name, today, market="KOSDAQ"),
+        )
 
-        # Convert Series to dictionaries and merge them
-        TICKER_MAP.update(kospi_series.to_dict())
-        TICKER_MAP.update(kosdaq_series.to_dict())
+        # Merge at the Series level, then materialize the dict once
+        merged = pd.concat([kospi_series, kosdaq_series])
+        TICKER_MAP.update(zip(merged.index.tolist(), merged.tolist()))
+        _TICKER_MAP_JSON = _json_dumps(TICKER_MAP)
 
-        logging.debug(f"Successfully stored information for {len(TICKER_MAP)} stocks")
+        try:
+            await _run_io(_write_ticker_cache, merged, cache_path)
+        except Exception as save_error:
+            logging.warning("Failed to save ticker cache (%s): %s", cache_path, save_error)
+
+        logging.debug("Successfully stored information for %d stocks", len(TICKER_MAP))
         return TICKER_MAP
 
     except Exception as e:
@@ -97,19 +455,22 @@ def load_all_tickers() -> Dict[str, str]:
 @mcp.resource("stock://tickers")
 def get_ticker_map() -> str:
     """Retrieves the stored ticker symbol-name mapping information."""
+    global _TICKER_MAP_JSON
     try:
         if not TICKER_MAP:
-            return json.dumps({"message": "No ticker information stored. Please run the load_all_tickers() tool first to load ticker information."})
+            return _json_dumps({"message": "No ticker information stored. Please run the load_all_tickers() tool first to load ticker information."})
 
         # Return formatted for better readability
         # result = ["[Ticker Symbol - Stock Name Mapping]"]
         # for ticker, name in TICKER_MAP.items():
         #     result.append(f"- {ticker}: {name}")
         # return "\n".join(result)
-        return json.dumps(TICKER_MAP)
+        if _TICKER_MAP_JSON is None:
+            _TICKER_MAP_JSON = _json_dumps(TICKER_MAP)
+        return _TICKER_MAP_JSON
 
     except Exception as e:
-      return json.dumps({"error": f"Failed to retrieve ticker information: {str(e)}"})
+      return _json_dumps({"error": f"Failed to retrieve ticker information: {str(e)}"})
 
 @mcp.prompt()
 def search_stock_data_prompt() -> str:
@@ -137,7 +498,7 @@ def search_stock_data_prompt() -> str:
     """
 
 @mcp.tool()
-def get_stock_ohlcv(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int], adjusted: bool = True) -> Dict[str, Any]:
+async def get_stock_ohlcv(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int], adjusted: bool = True) -> Dict[str, Any]:
     """Retrieves OHLCV (Open/High/Low/Close/Volume) data for a specific stock.
 
     Args:
@@ -159,47 +520,17 @@ def get_stock_ohlcv(fromdate: Union[str, int], todate: Union[str, int], ticker:
             2021-01-19  84500  88000  83600  87000  39895044
             2021-01-18  86600  87300  84100  85000  43227951
     """
-    # Validate and convert date format
-    def validate_date(date_str: Union[str, int]) -> str:
-        try:
-            if isinstance(date_str, int):
-                date_str = str(date_str)
-            # Convert if in YYYY-MM-DD format
-            if '-' in date_str:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                return parsed_date.strftime('%Y%m%d')
-            # Validate if in YYYYMMDD format
-            datetime.strptime(date_str, '%Y%m%d')
-            return date_str
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
-
-    def validate_ticker(ticker_str: Union[str, int]) -> str:
-        if isinstance(ticker_str, int):
-            return str(ticker_str)
-        return ticker_str
-
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = validate_ticker(ticker)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = _validate_ticker(ticker)
 
-        logging.debug(f"Retrieving stock OHLCV data: {ticker}, {fromdate}-{todate}, adjusted={adjusted}")
+        logging.debug("Retrieving stock OHLCV data: %s, %s-%s, adjusted=%s", ticker, fromdate, todate, adjusted)
 
         # Call get_market_ohlcv (changed adj -> adjusted)
-        df = get_market_ohlcv(fromdate, todate, ticker, adjusted=adjusted)
-
-        # Convert DataFrame to dictionary
-        result = df.to_dict(orient='index')
-
-        # Convert datetime index to string and sort in reverse
-        sorted_items = sorted(
-            ((k.strftime('%Y-%m-%d'), v) for k, v in result.items()),
-            reverse=True
-        )
-        result = dict(sorted_items)
+        df = await _run_io(_market_ohlcv, fromdate, todate, ticker, adjusted)
 
-        return result
+        return _df_to_sorted_dict(df)
 
     except Exception as e:
         error_message = f"Data retrieval failed: {str(e)}"
@@ -247,8 +578,15 @@ def get_stock_data_prompt() -> str:
 
 
 @mcp.tool()
-def update_stock_data(dataset_id: Optional[str] = None) -> Dict[str, Any]:
+async def update_stock_data(dataset_id: Optional[str] = None) -> Dict[str, Any]:
     """Triggers stock_update.StockDataUpdater to append missing OHLCV rows."""
+    # The updater performs blocking file I/O and KRX requests, so keep it off the event loop.
+    # It re-enters get_stock_ohlcv (which waits on _IO_EXECUTOR) for every dataset, so it runs on
+    # the default executor rather than holding one of the bounded I/O workers while it waits.
+    return await asyncio.to_thread(_update_stock_data_sync, dataset_id)
+
+
+def _update_stock_data_sync(dataset_id: Optional[str]) -> Dict[str, Any]:
     if StockDataUpdater is None:
         return {
             "error": "StockDataUpdater 모듈을 불러올 수 없습니다. "
@@ -285,7 +623,7 @@ def update_stock_data(dataset_id: Optional[str] = None) -> Dict[str, Any]:
     }
 
 @mcp.tool()
-def get_stock_market_cap(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
+async def get_stock_market_cap(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
     """Retrieves market capitalization data for a specific stock.
 
     Args:
@@ -304,47 +642,17 @@ def get_stock_market_cap(fromdate: Union[str, int], todate: Union[str, int], tic
             2015-07-21  186039062631000  194055  244129106000  147299337
             2015-07-20  187806654675000  128928  165366199000  147299337
     """
-    # Validate and convert date format
-    def validate_date(date_str: Union[str, int]) -> str:
-        try:
-            if isinstance(date_str, int):
-                date_str = str(date_str)
-            # Convert if in YYYY-MM-DD format
-            if '-' in date_str:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                return parsed_date.strftime('%Y%m%d')
-            # Validate if in YYYYMMDD format
-            datetime.strptime(date_str, '%Y%m%d')
-            return date_str
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
-
-    def validate_ticker(ticker_str: Union[str, int]) -> str:
-        if isinstance(ticker_str, int):
-            return str(ticker_str)
-        return ticker_str
-
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = validate_ticker(ticker)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = _validate_ticker(ticker)
 
-        logging.debug(f"Retrieving stock market capitalization data: {ticker}, {fromdate}-{todate}")
+        logging.debug("Retrieving stock market capitalization data: %s, %s-%s", ticker, fromdate, todate)
 
         # Call get_market_cap
-        df = get_market_cap(fromdate, todate, ticker)
-
-        # Convert DataFrame to dictionary
-        result = df.to_dict(orient='index')
+        df = await _run_io(_market_cap, fromdate, todate, ticker)
 
-        # Convert datetime index to string and sort in reverse
-        sorted_items = sorted(
-            ((k.strftime('%Y-%m-%d'), v) for k, v in result.items()),
-            reverse=True
-        )
-        result = dict(sorted_items)
-
-        return result
+        return _df_to_sorted_dict(df)
 
     except Exception as e:
         error_message = f"Data retrieval failed: {str(e)}"
@@ -352,7 +660,7 @@ def get_stock_market_cap(fromdate: Union[str, int], todate: Union[str, int], tic
         return {"error": error_message}
 
 @mcp.tool()
-def get_stock_fundamental(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
+async def get_stock_fundamental(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
     """Retrieves fundamental data (PER/PBR/Dividend Yield) for a specific stock.
 
     Args:
@@ -371,45 +679,17 @@ def get_stock_fundamental(fromdate: Union[str, int], todate: Union[str, int], ti
                 2021-01-05  37528  26.500000  2.240234  3166  1.690430  1416
                 2021-01-04  37528  26.218750  2.210938  3166  1.709961  1416
     """
-    # Validate and convert date format
-    def validate_date(date_str: Union[str, int]) -> str:
-        try:
-            if isinstance(date_str, int):
-                date_str = str(date_str)
-            if '-' in date_str:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                return parsed_date.strftime('%Y%m%d')
-            datetime.strptime(date_str, '%Y%m%d')
-            return date_str
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
-
-    def validate_ticker(ticker_str: Union[str, int]) -> str:
-        if isinstance(ticker_str, int):
-            return str(ticker_str)
-        return ticker_str
-
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = validate_ticker(ticker)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = _validate_ticker(ticker)
 
-        logging.debug(f"Retrieving stock fundamental data: {ticker}, {fromdate}-{todate}")
+        logging.debug("Retrieving stock fundamental data: %s, %s-%s", ticker, fromdate, todate)
 
         # Call get_market_fundamental_by_date
-        df = get_market_fundamental_by_date(fromdate, todate, ticker)
-
-        # Convert DataFrame to dictionary
-        result = df.to_dict(orient='index')
+        df = await _run_io(_market_fundamental, fromdate, todate, ticker)
 
-        # Convert datetime index to string and sort in reverse
-        sorted_items = sorted(
-            ((k.strftime('%Y-%m-%d'), v) for k, v in result.items()),
-            reverse=True
-        )
-        result = dict(sorted_items)
-
-        return result
+        return _df_to_sorted_dict(df)
 
     except Exception as e:
         error_message = f"Data retrieval failed: {str(e)}"
@@ -417,7 +697,7 @@ def get_stock_fundamental(fromdate: Union[str, int], todate: Union[str, int], ti
         return {"error": error_message}
 
 @mcp.tool()
-def get_stock_trading_volume(
+async def get_stock_trading_volume(
     fromdate: Union[str, int],
     todate: Union[str, int],
     ticker: Union[str, int],
@@ -435,28 +715,10 @@ def get_stock_trading_volume(
         detail=True 로 호출하면 금융투자, 보험, 투신, 사모, 은행, 연기금, 기타법인, 기타기관 등
         세부 투자자 그룹별 순매수 데이터를 포함합니다.
     """
-    # Validate and convert date format
-    def validate_date(date_str: Union[str, int]) -> str:
-        try:
-            if isinstance(date_str, int):
-                date_str = str(date_str)
-            if '-' in date_str:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                return parsed_date.strftime('%Y%m%d')
-            datetime.strptime(date_str, '%Y%m%d')
-            return date_str
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
-
-    def validate_ticker(ticker_str: Union[str, int]) -> str:
-        if isinstance(ticker_str, int):
-            return str(ticker_str)
-        return ticker_str
-
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = validate_ticker(ticker)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = _validate_ticker(ticker)
 
         logging.debug(
             "Retrieving stock trading volume by investor type: %s, %s-%s, detail=%s",
@@ -467,7 +729,8 @@ def get_stock_trading_volume(
         )
 
         # Call get_market_trading_volume_by_date with optional detail flag
-        df = get_market_trading_volume_by_date(
+        df = await _run_io(
+            get_market_trading_volume_by_date,
             fromdate,
             todate,
             ticker,
@@ -480,23 +743,25 @@ def get_stock_trading_volume(
             TRADING_VOLUME_EXPORT_DIR
             / f"trading_volume_{ticker}_{fromdate}_{todate}_{suffix}.csv"
         )
+        # Skip rewriting the snapshot when its contents have not changed since the last call
+        hash_path = csv_path.with_name(csv_path.name + ".hash")
         try:
-            df.to_csv(csv_path, encoding='utf-8-sig')
-            logging.info(f"Saved trading volume snapshot to CSV: {csv_path}")
+            fingerprint = _frame_fingerprint(df)
+            if (
+                csv_path.exists()
+                and hash_path.exists()
+                and hash_path.read_text(encoding="ascii").strip() == fingerprint
+            ):
+                logging.debug("Trading volume snapshot unchanged, skipping write: %s", csv_path)
+            else:
+                with open(csv_path, 'wb', buffering=CSV_WRITE_BUFFER_SIZE) as csv_file:
+                    df.to_csv(csv_file, encoding='utf-8-sig')
+                hash_path.write_text(fingerprint, encoding="ascii")
+                logging.info(f"Saved trading volume snapshot to CSV: {csv_path}")
         except Exception as save_error:
             logging.warning(f"Failed to save trading volume CSV ({csv_path}): {save_error}")
 
-        # Convert DataFrame to dictionary
-        result = df.to_dict(orient='index')
-
-        # Convert datetime index to string and sort in reverse
-        sorted_items = sorted(
-            ((k.strftime('%Y-%m-%d'), v) for k, v in result.items()),
-            reverse=True
-        )
-        result = dict(sorted_items)
-
-        return result
+        return _df_to_sorted_dict(df)
 
     except Exception as e:
         error_message = f"Data retrieval failed: {str(e)}"
@@ -505,40 +770,23 @@ def get_stock_trading_volume(
 
 
 @mcp.tool()
-def get_investor_trading_volume(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
+async def get_investor_trading_volume(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
     """Retrieves aggregate trading volume by investor type (sell/buy/net) for a stock.
 
     Mirrors pykrx's ``get_market_trading_volume_by_investor`` so tools can
     programmatically fetch tables such as 금융투자/보험/투신 등 투자자 그룹의 순매수 현황.
     """
 
-    def validate_date(date_str: Union[str, int]) -> str:
-        try:
-            if isinstance(date_str, int):
-                date_str = str(date_str)
-            if '-' in date_str:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                return parsed_date.strftime('%Y%m%d')
-            datetime.strptime(date_str, '%Y%m%d')
-            return date_str
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
-
-    def validate_ticker(ticker_str: Union[str, int]) -> str:
-        if isinstance(ticker_str, int):
-            return str(ticker_str)
-        return ticker_str
-
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = validate_ticker(ticker)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = _validate_ticker(ticker)
 
         logging.debug(
             f"Retrieving investor trading volume: ticker={ticker}, range={fromdate}-{todate}"
         )
 
-        df = get_market_trading_volume_by_investor(fromdate, todate, ticker)
+        df = await _run_io(get_market_trading_volume_by_investor, fromdate, todate, ticker)
         result = df.to_dict(orient='index')
 
         # Ensure index labels (investor categories) are strings for JSON output
@@ -552,48 +800,38 @@ def get_investor_trading_volume(fromdate: Union[str, int], todate: Union[str, in
 
 
 @mcp.tool()
-def export_stock_ohlcv_dataset(
+async def export_stock_ohlcv_dataset(
     fromdate: Union[str, int],
     todate: Union[str, int],
     ticker: Union[str, int],
     dataset_name: Optional[str] = None,
     adjusted: bool = True,
+    format: str = "csv",
 ) -> Dict[str, Any]:
-    """Exports OHLCV 데이터셋을 ETHUSDT CSV 포맷(date/open/high/low/close/volume)으로 저장합니다.
+    """Exports OHLCV 데이터셋을 ETHUSDT 포맷(date/open/high/low/close/volume)으로 저장합니다.
 
     Args:
         fromdate, todate: 조회 구간 (YYYYMMDD or YYYY-MM-DD)
         ticker: 6자리 종목 코드
         dataset_name: 저장할 파일명(확장자 제외). 미입력 시 ``{ticker}_{from}_{to}_OHLCV`` 사용
         adjusted: 수정주가 사용 여부
+        format: ``"csv"`` (기본값) 또는 Snappy 압축 ``"parquet"`` (pyarrow 필요)
     Returns:
-        저장된 CSV 경로와 행 수 등의 메타데이터
+        저장된 파일 경로와 행 수 등의 메타데이터
     """
 
-    def validate_date(date_value: Union[str, int]) -> str:
-        try:
-            if isinstance(date_value, int):
-                date_value = str(date_value)
-            if "-" in str(date_value):
-                parsed = datetime.strptime(str(date_value), "%Y-%m-%d")
-                return parsed.strftime("%Y%m%d")
-            datetime.strptime(str(date_value), "%Y%m%d")
-            return str(date_value)
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_value}")
-
-    def normalize_ticker(value: Union[str, int]) -> str:
-        return str(value).strip()
-
     def resolve_dataset_name(default_ticker: str, start: str, end: str, custom: Optional[str]) -> str:
         if custom:
             return custom.strip().replace(" ", "_")
         return f"{default_ticker}_{start}_{end}_OHLCV"
 
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = normalize_ticker(ticker)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = str(ticker).strip()
+        export_format = str(format).strip().lower()
+        if export_format not in ("parquet", "csv"):
+            raise ValueError(f"format must be 'parquet' or 'csv'. Input value: {format}")
 
         logging.debug(
             "Exporting OHLCV dataset: ticker=%s, range=%s-%s, adjusted=%s",
@@ -603,35 +841,25 @@ def export_stock_ohlcv_dataset(
             adjusted,
         )
 
-        df = get_market_ohlcv(fromdate, todate, ticker, adjusted=adjusted)
+        df = await _run_io(_market_ohlcv, fromdate, todate, ticker, adjusted)
         if df.empty:
             raise ValueError("No OHLCV data returned for the requested range.")
 
-        column_aliases = {
-            "시가": "open",
-            "고가": "high",
-            "저가": "low",
-            "종가": "close",
-            "거래량": "volume",
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "close": "close",
-            "volume": "volume",
-        }
-
-        normalized_df = pd.DataFrame(index=df.index)
-        for column in df.columns:
-            raw = str(column).strip()
-            alias = column_aliases.get(raw) or column_aliases.get(raw.lower())
-            if alias in {"open", "high", "low", "close", "volume"}:
-                normalized_df[alias] = pd.to_numeric(df[column], errors="coerce")
-
+        renamed = df.rename(columns=_normalize_ohlcv_column)
         required_cols = ["open", "high", "low", "close", "volume"]
-        missing_cols = [col for col in required_cols if col not in normalized_df.columns]
+        missing_cols = [col for col in required_cols if col not in renamed.columns]
         if missing_cols:
             raise ValueError(f"Missing required OHLCV columns: {', '.join(missing_cols)}")
 
+        # pykrx는 보통 숫자 dtype으로 돌려주므로 object 컬럼만 to_numeric으로 변환한다
+        normalized_df = renamed[required_cols]
+        coerced = {
+            col: pd.to_numeric(normalized_df[col], errors="coerce")
+            for col in required_cols
+            if normalized_df[col].dtype.kind not in "iufb"
+        }
+        if coerced:
+            normalized_df = normalized_df.assign(**coerced)
         normalized_df = normalized_df.dropna(subset=["open", "high", "low", "close"])
         normalized_df["volume"] = normalized_df["volume"].fillna(0)
         if normalized_df.empty:
@@ -641,13 +869,20 @@ def export_stock_ohlcv_dataset(
         normalized_df = normalized_df[["date", "open", "high", "low", "close", "volume"]]
 
         dataset_id = resolve_dataset_name(ticker, fromdate, todate, dataset_name)
-        csv_path = STOCK_DATA_EXPORT_DIR / f"{dataset_id}.csv"
-        normalized_df.to_csv(csv_path, index=False)
-
-        logging.info("Saved OHLCV dataset to %s (%d rows)", csv_path, len(normalized_df))
+        if export_format == "parquet":
+            # Parquet에는 date를 문자열 대신 타임스탬프로 저장해 읽는 쪽에서 파싱이 필요 없다
+            export_path = STOCK_DATA_EXPORT_DIR / f"{dataset_id}.parquet"
+            normalized_df.assign(date=pd.to_datetime(normalized_df["date"])).to_parquet(
+                export_path, engine="pyarrow", compression="snappy", index=False
+            )
+        else:
+            export_path = STOCK_DATA_EXPORT_DIR / f"{dataset_id}.csv"
+            normalized_df.to_csv(export_path, index=False)
+
+        logging.info("Saved OHLCV dataset to %s (%d rows)", export_path, len(normalized_df))
 
         return {
-            "file": str(csv_path),
+            "file": str(export_path),
             "dataset_id": dataset_id,
             "rows": len(normalized_df),
             "start": normalized_df["date"].iloc[0],
@@ -660,71 +895,70 @@ def export_stock_ohlcv_dataset(
         return {"error": error_message}
 
 
+def _write_investor_daily_csv(csv_path: Path, display_days: list, frames: list) -> int:
+    """Writes one row per (day, investor) in date order and returns the number of rows written."""
+    total_rows = 0
+    fieldnames = ["date", "investor", "sell", "buy", "net"]
+    raw_file = csv_path.open("wb", buffering=CSV_WRITE_BUFFER_SIZE)
+    with io.TextIOWrapper(raw_file, encoding="utf-8-sig", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+
+        for display_day, df in zip(display_days, frames):
+            if df.empty:
+                continue
+            day_table = df.reset_index()
+            investors = day_table[day_table.columns[0]].astype(str).to_numpy()
+            volumes, valid = _investor_volumes(day_table)
+
+            # 값이 비어 있는 행은 기존과 같이 경고만 남기고 건너뛴다
+            if not valid.all():
+                for investor in investors[~valid]:
+                    logging.warning(
+                        f"Skipping row for {display_day}/{investor} due to error: missing volume value"
+                    )
+                investors, volumes = investors[valid], volumes[valid]
+
+            writer.writerows(
+                (display_day, investor, sell, buy, net)
+                for investor, (sell, buy, net) in zip(investors.tolist(), volumes.tolist())
+            )
+            total_rows += len(investors)
+    return total_rows
+
+
 @mcp.tool()
-def export_daily_investor_trading_volume(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
+async def export_daily_investor_trading_volume(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int]) -> Dict[str, Any]:
     """Exports day-by-day investor trading volume (sell/buy/net) to a CSV file.
 
     Returns metadata about the written CSV so downstream tools can load it.
     """
 
-    def validate_date(date_str: Union[str, int]) -> str:
-        try:
-            if isinstance(date_str, int):
-                date_str = str(date_str)
-            if '-' in date_str:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                return parsed_date.strftime('%Y%m%d')
-            datetime.strptime(date_str, '%Y%m%d')
-            return date_str
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
-
-    def validate_ticker(ticker_str: Union[str, int]) -> str:
-        if isinstance(ticker_str, int):
-            return str(ticker_str)
-        return ticker_str
-
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = validate_ticker(ticker)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = _validate_ticker(ticker)
 
         logging.debug(
             f"Exporting daily investor trading volume: ticker={ticker}, range={fromdate}-{todate}"
         )
 
-        business_days = get_previous_business_days(fromdate=fromdate, todate=todate)
+        business_days = await _run_io(get_previous_business_days, fromdate=fromdate, todate=todate)
         if not business_days:
             raise ValueError("No business days found for the provided date range.")
 
+        # 영업일 문자열은 DatetimeIndex에서 한 번에 만든다
+        days = pd.DatetimeIndex(business_days)
+        day_strs = days.strftime("%Y%m%d").tolist()
+        display_days = days.strftime("%Y-%m-%d").tolist()
+
+        # 영업일별 요청은 공유 I/O 풀에서 병렬로 보내고, 결과는 원래 날짜 순서대로 기록한다
+        frames = await asyncio.gather(
+            *(_run_io(get_market_trading_volume_by_investor, day_str, day_str, ticker) for day_str in day_strs)
+        )
+
         csv_path = INVESTOR_DAILY_EXPORT_DIR / f"investor_daily_{ticker}_{fromdate}_{todate}.csv"
-        total_rows = 0
-        fieldnames = ["date", "investor", "sell", "buy", "net"]
-        with csv_path.open("w", newline="", encoding="utf-8-sig") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for ts in business_days:
-                day_str = ts.strftime("%Y%m%d")
-                display_day = ts.strftime("%Y-%m-%d")
-                df = get_market_trading_volume_by_investor(day_str, day_str, ticker)
-                if df.empty:
-                    continue
-                day_table = df.reset_index()
-                investor_col = day_table.columns[0]
-                for _, row in day_table.iterrows():
-                    try:
-                        writer.writerow({
-                            "date": display_day,
-                            "investor": str(row[investor_col]),
-                            "sell": int(row.get("매도", 0)),
-                            "buy": int(row.get("매수", 0)),
-                            "net": int(row.get("순매수", 0)),
-                        })
-                        total_rows += 1
-                    except Exception as write_error:
-                        logging.warning(
-                            f"Skipping row for {display_day}/{row[investor_col]} due to error: {write_error}"
-                        )
+        total_rows = await _run_io(_write_investor_daily_csv, csv_path, display_days, frames)
 
         logging.info(
             f"Saved daily investor trading volume CSV ({total_rows} rows) to {csv_path}"
@@ -743,8 +977,8 @@ def export_daily_investor_trading_volume(fromdate: Union[str, int], todate: Unio
 
 
 @mcp.tool()
-def get_index_ohlcv(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int], freq: str = 'd') -> \
-Dict[str, Any]:
+async def get_index_ohlcv(fromdate: Union[str, int], todate: Union[str, int], ticker: Union[str, int], freq: str = 'd',
+                          compact: bool = False) -> Dict[str, Any]:
     """Retrieves OHLCV data for a specific index.
 
     Args:
@@ -752,6 +986,8 @@ Dict[str, Any]:
         todate   (str): End date for retrieval (YYYYMMDD)
         ticker   (str): Index ticker symbol (e.g., 1001 for KOSPI, 2001 for KOSDAQ)
         freq     (str, optional): d - daily / m - monthly / y - yearly. Defaults to 'd'.
+        compact  (bool, optional): Return {'dates': [...], 'rows': [...]} (newest first) instead of
+            {date: row}. Defaults to False.
 
     Returns:
         DataFrame:
@@ -765,53 +1001,29 @@ Dict[str, Any]:
             2021-01-08  3040.11  3161.11  3040.11  3152.18  1297903388  40909490005818
     """
 
-    # Validate and convert date format
-    def validate_date(date_str: Union[str, int]) -> str:
-        try:
-            if isinstance(date_str, int):
-                date_str = str(date_str)
-            if '-' in date_str:
-                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                return parsed_date.strftime('%Y%m%d')
-            datetime.strptime(date_str, '%Y%m%d')
-            return date_str
-        except ValueError:
-            raise ValueError(f"Date must be in YYYYMMDD format. Input value: {date_str}")
-
-    def validate_ticker(ticker_str: Union[str, int]) -> str:
-        if isinstance(ticker_str, int):
-            return str(ticker_str)
-        return ticker_str
-
-    def validate_freq(freq_str: str) -> str:
-        valid_freqs = ['d', 'm', 'y']
-        if freq_str not in valid_freqs:
-            raise ValueError(f"Frequency must be one of {valid_freqs}. Input value: {freq_str}")
-        return freq_str
-
     try:
-        fromdate = validate_date(fromdate)
-        todate = validate_date(todate)
-        ticker = validate_ticker(ticker)
-        freq = validate_freq(freq)
+        fromdate = _validate_date(fromdate)
+        todate = _validate_date(todate)
+        ticker = _validate_ticker(ticker)
+        freq = _validate_freq(freq)
 
-        logging.debug(f"Retrieving index OHLCV data: {ticker}, {fromdate}-{todate}, freq={freq}")
+        logging.debug("Retrieving index OHLCV data: %s, %s-%s, freq=%s", ticker, fromdate, todate, freq)
 
         # Call get_index_ohlcv_by_date
         # Note: name_display is set to False to match the pattern of other functions
-        df = get_index_ohlcv_by_date(fromdate, todate, ticker, freq=freq, name_display=False)
-
-        # Convert DataFrame to dictionary
-        result = df.to_dict(orient='index')
-
-        # Convert datetime index to string and sort in reverse
-        sorted_items = sorted(
-            ((k.strftime('%Y-%m-%d'), v) for k, v in result.items()),
-            reverse=True
+        if _is_closed_range(todate):
+            # 지난 구간은 변하지 않으므로 변환 결과까지 캐시한다
+            rows = await _run_io(_cached_index_ohlcv_rows, fromdate, todate, ticker, freq)
+            if compact:
+                return {"dates": [date for date, _ in rows], "rows": [row for _, row in rows]}
+            return dict(rows)
+
+        # 오늘을 포함한 구간은 당일 값이 바뀌므로 매번 새로 조회한다
+        df = await _run_io(
+            get_index_ohlcv_by_date, fromdate, todate, ticker, freq=freq, name_display=False
         )
-        result = dict(sorted_items)
 
-        return result
+        return _df_to_compact(df) if compact else _df_to_sorted_dict(df)
 
     except Exception as e:
         error_message = f"Data retrieval failed: {str(e)}"
@@ -819,63 +1031,130 @@ Dict[str, Any]:
         return {"error": error_message}
 
 
-def main():
-    mcp.run()
+@mcp.tool()
+def clear_caches() -> Dict[str, Any]:
+    """Clears the in-memory KRX query caches so the next call refetches from KRX.
+
+    Returns:
+        Dict[str, Any]: Number of cached entries that were dropped.
+    """
+    cleared = 0
+    for cached in _KRX_CACHES:
+        cleared += cached.cache_info().currsize
+        cached.cache_clear()
+    logging.info(f"Cleared {cleared} cached KRX responses")
+    return {"cleared": cleared}
 
 
-if __name__ == "__main__":
-    main()
-    
 @mcp.tool()
-def fetch_bybit_candles(symbol: str, timeframe: str = '1d', limit: int = 200) -> Dict[str, Any]:
-    """Fetches OHLCV data from Bybit and saves it as a CSV file.
+async def fetch_bybit_candles(symbol: str, timeframe: str = '1d', limit: int = 200, format: str = 'csv') -> Dict[str, Any]:
+    """Fetches OHLCV data from Bybit and saves it as a CSV (or Parquet/Feather) file.
 
     Args:
         symbol (str): Trading pair symbol (e.g., 'BTC/USDT', 'ETH/USDT').
         timeframe (str, optional): Candle timeframe ('1d', '1h', '15m', etc.). Defaults to '1d'.
         limit (int, optional): Number of candles to fetch. Defaults to 200.
+        format (str, optional): 'csv' (default), 'parquet' (Snappy) or 'feather' (uncompressed).
 
     Returns:
         Dict[str, Any]: Metadata about the saved dataset.
     """
+    return await _run_io(_fetch_bybit_candles_sync, symbol, timeframe, limit, format)
+
+
+def _fetch_bybit_candles_sync(symbol: str, timeframe: str, limit: int, format: str) -> Dict[str, Any]:
     try:
-        logging.debug(f"Fetching Bybit candles: {symbol}, {timeframe}, limit={limit}")
+        export_format = str(format).strip().lower()
+        if export_format not in ('csv', 'parquet', 'feather'):
+            raise ValueError(f"format must be 'csv', 'parquet' or 'feather'. Input value: {format}")
+
+        logging.debug("Fetching Bybit candles: %s, %s, limit=%s", symbol, timeframe, limit)
         
-        exchange = ccxt.bybit()
-        ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        exchange = _get_bybit()
+        ohlcv = _fetch_bybit_ohlcv(exchange, symbol, timeframe, limit)
         
         if not ohlcv:
             raise ValueError(f"No data returned from Bybit for {symbol}")
 
-        # Convert to DataFrame
-        # ccxt structure: [timestamp, open, high, low, close, volume]
-        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        
-        # Convert timestamp (ms) to datetime string
-        df['date'] = pd.to_datetime(df['timestamp'], unit='ms')
-        
-        # Format date column. For '1d', we might want YYYY-MM-DD. For others, full timestamp.
-        # To be safe and consistent with main.py's parser, we'll use a full ISO-like string.
-        df['date'] = df['date'].dt.strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Reorder columns to match expected format: date, open, high, low, close, volume
-        df = df[['date', 'open', 'high', 'low', 'close', 'volume']]
-        
         # Generate filename
         safe_symbol = symbol.replace('/', '')
         dataset_id = f"{safe_symbol}_{timeframe}_OHLCV"
-        csv_path = CRYPTO_DATA_EXPORT_DIR / f"{dataset_id}.csv"
+        export_path = CRYPTO_DATA_EXPORT_DIR / f"{dataset_id}.{export_format}"
+
+        # ccxt structure: [timestamp, open, high, low, close, volume]
+        if export_format == 'csv' and len(ohlcv) <= BYBIT_DIRECT_WRITE_MAX_ROWS:
+            # Small batches: format the CSV straight from the ccxt rows, no DataFrame needed
+            dates = [
+                datetime.fromtimestamp(row[0] // 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+                for row in ohlcv
+            ]
+            with open(export_path, 'w', newline='') as csv_file:
+                csv_file.write("date,open,high,low,close,volume\n")
+                csv_file.writelines(
+                    f"{date},{_csv_price(o)},{_csv_price(h)},{_csv_price(l)},{_csv_price(c)},{_csv_price(v)}\n"
+                    for date, (_, o, h, l, c, v) in zip(dates, ohlcv)
+                )
+            logging.info(f"Saved Bybit dataset to {export_path} ({len(ohlcv)} rows)")
+
+            return {
+                "file": str(export_path),
+                "dataset_id": dataset_id,
+                "rows": len(ohlcv),
+                "start": dates[0],
+                "end": dates[-1],
+                "symbol": symbol,
+                "timeframe": timeframe
+            }
+
+        # Convert to DataFrame: one float64 array, then column views (skips pandas' list-of-lists inference)
+        values = np.asarray(ohlcv, dtype=np.float64)
+        timestamps = values[:, 0].astype(np.int64)
+        df = pd.DataFrame({
+            'timestamp': timestamps,
+            'open': values[:, 1],
+            'high': values[:, 2],
+            'low': values[:, 3],
+            'close': values[:, 4],
+            'volume': values[:, 5],
+        }, copy=False)
         
-        # Save to CSV
-        df.to_csv(csv_path, index=False)
-        logging.info(f"Saved Bybit dataset to {csv_path} ({len(df)} rows)")
+        # Convert timestamp (ms) to a full 'YYYY-MM-DD HH:MM:SS' string, consistent with main.py's parser.
+        # NumPy's datetime64 -> str cast yields 'YYYY-MM-DDTHH:MM:SS' in one C loop (no strftime).
+        seconds = timestamps.astype('datetime64[ms]').astype('datetime64[s]')
+        if export_format == 'csv':
+            df.insert(0, 'date', np.char.replace(seconds.astype('U19'), 'T', ' '))
+        else:
+            # Columnar formats keep date as a real timestamp so readers skip string parsing
+            df.insert(0, 'date', seconds)
+        df.drop(columns=['timestamp'], inplace=True)
+
+        # Expected format: date, open, high, low, close, volume (the frame is built in this order)
+        columns = ['date', 'open', 'high', 'low', 'close', 'volume']
         
+        if export_format == 'parquet':
+            df.to_parquet(export_path, engine='pyarrow', compression='snappy', index=False)
+        elif export_format == 'feather':
+            # Compression dominates Feather write time, so store it uncompressed
+            df.to_feather(export_path, compression='uncompressed')
+        else:
+            # Save to CSV: stream the column lists through csv.writer with a large write buffer
+            with open(export_path, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as csv_file:
+                writer = csv.writer(csv_file, lineterminator='\n')
+                writer.writerow(columns)
+                writer.writerows(zip(*(
+                    _blank_missing(df[column].tolist()) if df[column].hasnans else df[column].tolist()
+                    for column in columns
+                )))
+        logging.info(f"Saved Bybit dataset to {export_path} ({len(df)} rows)")
+
+        # ccxt returns candles in ascending order, so the range comes straight from the raw rows
+        start_ts, end_ts = ohlcv[0][0], ohlcv[-1][0]
         return {
-            "file": str(csv_path),
+            "file": str(export_path),
             "dataset_id": dataset_id,
             "rows": len(df),
-            "start": df['date'].iloc[0],
-            "end": df['date'].iloc[-1],
+            "start": datetime.fromtimestamp(start_ts // 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+            "end": datetime.fromtimestamp(end_ts // 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
             "symbol": symbol,
             "timeframe": timeframe
         }
@@ -887,7 +1166,7 @@ def fetch_bybit_candles(symbol: str, timeframe: str = '1d', limit: int = 200) ->
 
 
 @mcp.tool()
-def get_nasdaq_ohlcv(
+async def get_nasdaq_ohlcv(
     ticker: str,
     period: str = "1mo",
     interval: str = "1d"
@@ -902,10 +1181,14 @@ def get_nasdaq_ohlcv(
     Returns:
         Dictionary containing OHLCV data.
     """
+    return await _run_io(_get_nasdaq_ohlcv_sync, ticker, period, interval)
+
+
+def _get_nasdaq_ohlcv_sync(ticker: str, period: str, interval: str) -> Dict[str, Any]:
     try:
-        logging.debug(f"Retrieving NASDAQ OHLCV: {ticker}, period={period}, interval={interval}")
+        logging.debug("Retrieving NASDAQ OHLCV: %s, period=%s, interval=%s", ticker, period, interval)
         
-        df = yf.download(ticker, period=period, interval=interval, progress=False)
+        df = _get_yf().download(ticker, period=period, interval=interval, progress=False)
         
         if df.empty:
             return {"error": f"No data found for {ticker}"}
@@ -928,17 +1211,11 @@ def get_nasdaq_ohlcv(
         available_cols = [c for c in required_cols if c in df.columns]
         df = df[available_cols].dropna()
 
-        # Convert to dict with date as key (or list of records)
-        # Using orient='index' with date string keys
-        result = {}
-        for date, row in df.iterrows():
-            date_str = date.strftime("%Y-%m-%d")
-            result[date_str] = row.to_dict()
-            
-        # Sort by date descending
-        sorted_result = dict(sorted(result.items(), key=lambda item: item[0], reverse=True))
-        
-        return sorted_result
+        # Keys are YYYY-MM-DD, so for intraday intervals keep the last bar of each day
+        df = df[~df.index.normalize().duplicated(keep="last")]
+
+        # Convert to dict with date string keys, sorted by date descending
+        return _df_to_sorted_dict(df)
 
     except Exception as e:
         error_message = f"Failed to retrieve NASDAQ OHLCV: {str(e)}"
@@ -947,7 +1224,7 @@ def get_nasdaq_ohlcv(
 
 
 @mcp.tool()
-def get_nasdaq_fundamental(ticker: str) -> Dict[str, Any]:
+async def get_nasdaq_fundamental(ticker: str) -> Dict[str, Any]:
     """Retrieves fundamental data (Market Cap, P/E, etc.) for a US stock.
 
     Args:
@@ -956,10 +1233,14 @@ def get_nasdaq_fundamental(ticker: str) -> Dict[str, Any]:
     Returns:
         Dictionary of key fundamental metrics.
     """
+    return await _run_io(_get_nasdaq_fundamental_sync, ticker)
+
+
+def _get_nasdaq_fundamental_sync(ticker: str) -> Dict[str, Any]:
     try:
-        logging.debug(f"Retrieving NASDAQ fundamentals: {ticker}")
+        logging.debug("Retrieving NASDAQ fundamentals: %s", ticker)
         
-        ticker_obj = yf.Ticker(ticker)
+        ticker_obj = _get_yf().Ticker(ticker)
         info = ticker_obj.info
         
         # Select key metrics to avoid returning too much data
@@ -977,3 +1258,18 @@ def get_nasdaq_fundamental(ticker: str) -> Dict[str, Any]:
         error_message = f"Failed to retrieve NASDAQ fundamentals: {str(e)}"
         logging.error(error_message)
         return {"error": error_message}
+
+
+def _prewarm_tools() -> None:
+    """Builds the MCP tool listing once at startup so the first client request doesn't pay for it."""
+    tools = asyncio.run(mcp.list_tools())
+    logging.info("Registered %d MCP tools", len(tools))
+
+
+def main():
+    _prewarm_tools()
+    mcp.run()
+
+
+if __name__ == "__main__":
+    main()
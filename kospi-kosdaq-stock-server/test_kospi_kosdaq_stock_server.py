@@ -0,0 +1,86 @@
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import kospi_kosdaq_stock_server as server  # noqa: E402
+
+
+def _rejects_date(value) -> bool:
+    try:
+        server._validate_date(value)
+    except ValueError:
+        return True
+    return False
+
+
+def test_validate_date_accepts_both_shapes():
+    assert server._validate_date("20240105") == "20240105"
+    assert server._validate_date(20240105) == "20240105"
+    assert server._validate_date("2024-01-05") == "20240105"
+    # strptime('%Y-%m-%d') never required zero padding
+    assert server._validate_date("2024-1-5") == "20240105"
+    assert server._validate_date("2024-01-5") == "20240105"
+    assert server._validate_date("2024-1-05") == "20240105"
+
+
+def test_validate_date_leap_day():
+    assert server._validate_date("20240229") == "20240229"
+    assert server._validate_date("2024-2-29") == "20240229"
+    assert _rejects_date("20230229")
+    assert _rejects_date("2023-02-29")
+
+
+def test_validate_date_rejects_bad_input():
+    assert _rejects_date("18991231")
+    assert _rejects_date("2101-01-01")
+    assert _rejects_date("2024-13-01")
+    assert _rejects_date("20240101\n")
+    assert _rejects_date("２０２４０１０１")
+
+
+# ccxt rows: [timestamp, open, high, low, close, volume]
+_BYBIT_ROWS = [
+    [1704067200000, 42100.5, 42500.0, 41800.25, 42250.0, 1234.5],
+    [1704153600000, 42250.0, 42900.0, 42000.0, 42800.5, None],
+    [1704240000000, 42000, 43100.0, 41950.0, 43000.0, 12],
+]
+
+
+class _FakeBybit:
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        return [list(row) for row in _BYBIT_ROWS]
+
+
+def _bybit_csv_text(direct_write_max_rows: int) -> str:
+    saved = (server._BYBIT, server.CRYPTO_DATA_EXPORT_DIR, server.BYBIT_DIRECT_WRITE_MAX_ROWS)
+    with tempfile.TemporaryDirectory() as tmp:
+        server._BYBIT = _FakeBybit()
+        server.CRYPTO_DATA_EXPORT_DIR = Path(tmp)
+        server.BYBIT_DIRECT_WRITE_MAX_ROWS = direct_write_max_rows
+        try:
+            result = asyncio.run(server.fetch_bybit_candles("BTC/USDT", "1d", limit=len(_BYBIT_ROWS)))
+            return Path(result["file"]).read_text()
+        finally:
+            server._BYBIT, server.CRYPTO_DATA_EXPORT_DIR, server.BYBIT_DIRECT_WRITE_MAX_ROWS = saved
+
+
+def test_bybit_csv_matches_dataframe_to_csv():
+    frame = pd.DataFrame(_BYBIT_ROWS, columns=["timestamp", "open", "high", "low", "close", "volume"])
+    frame.insert(0, "date", pd.to_datetime(frame.pop("timestamp"), unit="ms").dt.strftime("%Y-%m-%d %H:%M:%S"))
+    expected = frame.to_csv(index=False)
+    # Small fetches are formatted straight from the ccxt rows, large ones go through a frame
+    assert _bybit_csv_text(direct_write_max_rows=5000) == expected
+    assert _bybit_csv_text(direct_write_max_rows=0) == expected
+
+
+if __name__ == "__main__":
+    test_validate_date_accepts_both_shapes()
+    test_validate_date_leap_day()
+    test_validate_date_rejects_bad_input()
+    test_bybit_csv_matches_dataframe_to_csv()
+    print("ok")
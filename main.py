@@ -1,26 +1,52 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
 import uvicorn
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
 from indicator.rsi import RSI_COLOR, compute_rsi
 from indicator.obv import compute_obv
-from indicator.ad import compute_ad
+from indicator.ad import ad_line_values
+from indicator import _jit as indicator_jit
+from ohlcv_io import load_ohlcv
 
 
 STOCK_DIR = Path(__file__).with_name("stock_data")
 CRYPTO_DIR = Path(__file__).with_name("crypto_data")
 NASDAQ_DIR = Path(__file__).with_name("nasdaq_data")
 DEFAULT_DATASET_ID = "ETHUSDT_2Y_OHLCV_Trans"
+# Parquet/Feather-only exports (e.g. from the MCP server) are listed alongside
+# CSVs; load_ohlcv picks whichever file exists for the dataset.
+DATASET_SUFFIXES = {".csv", ".parquet", ".feather"}
+# Cleaned price frames are cached as Feather (Arrow IPC) under <data dir>/_cache/
+PRICE_CACHE_DIRNAME = "_cache"
 UP_COLOR = "#089981"
 DOWN_COLOR = "#f23645"
 UP_VOLUME_COLOR = "rgba(8, 153, 129, 0.4)"
 DOWN_VOLUME_COLOR = "rgba(242, 54, 69, 0.4)"
 OBV_COLOR = "#008080"  # teal tone for OBV line
+# Indexed by (close >= open): 0 -> down, 1 -> up
+VOLUME_COLORS = np.array([DOWN_VOLUME_COLOR, UP_VOLUME_COLOR], dtype=object)
+# /api/candles payload shapes: per-point dicts ("rows") or shared arrays ("columns")
+CHART_LAYOUTS = ("rows", "columns")
 ALLOWED_INTERVAL_RULES = {
     "1d": "1D",
     "3d": "3D",
@@ -28,17 +54,52 @@ ALLOWED_INTERVAL_RULES = {
 }
 
 
+def _price_cache_path(csv_path: Path) -> Path:
+    return csv_path.parent / PRICE_CACHE_DIRNAME / f"{csv_path.stem}.price.feather"
+
+
+def _source_mtime_ns(csv_path: Path) -> Optional[int]:
+    """Newest mtime among the dataset's source files (.csv/.parquet/.feather), if any exist."""
+    mtimes = []
+    for suffix in DATASET_SUFFIXES:
+        try:
+            mtimes.append(csv_path.with_suffix(suffix).stat().st_mtime_ns)
+        except FileNotFoundError:
+            continue
+    return max(mtimes) if mtimes else None
+
+
+def _load_cached_price_data(csv_path: Path) -> Optional[pd.DataFrame]:
+    """Return the cleaned frame cached for ``csv_path`` if it is newer than every source file."""
+    cache_path = _price_cache_path(csv_path)
+    source_mtime = _source_mtime_ns(csv_path)
+    if source_mtime is None or not cache_path.exists():
+        return None
+    if cache_path.stat().st_mtime_ns < source_mtime:
+        return None
+    try:
+        return pd.read_feather(cache_path).set_index("date")
+    except Exception as exc:
+        print(f"Ignoring unreadable price cache {cache_path}: {exc}")
+        return None
+
+
 def load_price_data(csv_path: Path) -> pd.DataFrame:
     """Load and clean OHLCV data from CSV."""
+    cached = _load_cached_price_data(csv_path)
+    if cached is not None:
+        return cached
+
     data = (
-        pd.read_csv(csv_path, parse_dates=["date"])
+        load_ohlcv(csv_path)
         .set_index("date")
         .sort_index()
     )
     numeric_cols = ["open", "high", "low", "close", "volume"]
-    data[numeric_cols] = data[numeric_cols].apply(
-        pd.to_numeric, errors="coerce"
-    )
+    # Arrow 리더가 이미 float64로 읽은 컬럼은 건너뛰고, 문자열이 섞인 컬럼만 개별 변환한다
+    for col in numeric_cols:
+        if data[col].dtype.kind not in "iufb":
+            data[col] = pd.to_numeric(data[col], errors="coerce")
     cleaned = data.dropna(subset=numeric_cols)
     # filter out rows where prices or volume are obviously invalid (all zeros etc.)
     invalid_prices = (
@@ -48,34 +109,57 @@ def load_price_data(csv_path: Path) -> pd.DataFrame:
     )
     invalid_volume = cleaned["volume"] == 0
     cleaned = cleaned[~(invalid_prices | invalid_volume)]
+
+    # 정리된 프레임을 Feather로 남겨 다음 기동 때 CSV 파싱/정리를 건너뛴다
+    # (Arrow IPC라 디코딩 없이 바로 매핑되어 Parquet보다 읽기가 빠르다)
+    cache_path = _price_cache_path(csv_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cleaned.reset_index().to_feather(cache_path)
+    except Exception as exc:
+        print(f"Failed to write price cache {cache_path}: {exc}")
     return cleaned
 
 
+def _dataset_dirs_state() -> tuple:
+    """Directory mtimes; adding, removing or renaming a dataset file changes them."""
+    return tuple(
+        directory.stat().st_mtime_ns if directory.exists() else None
+        for directory in (STOCK_DIR, CRYPTO_DIR, NASDAQ_DIR)
+    )
+
+
 def get_dataset_catalog() -> Dict[str, Path]:
+    # 요청마다 세 폴더를 iterdir 하지 않도록 폴더 mtime이 같으면 이전 스캔을 재사용한다
+    catalog = _scan_dataset_catalog(_dataset_dirs_state())
+    if not catalog:
+        # 빈 결과도 캐시되므로 폴더가 비어 있는 동안에는 재스캔 없이 바로 에러를 낸다
+        raise ValueError("데이터셋 폴더(stock_data, crypto_data, nasdaq_data)에 CSV 파일이 없습니다.")
+    return catalog
+
+
+@lru_cache(maxsize=1)
+def _scan_dataset_catalog(dirs_state: tuple) -> Dict[str, Path]:
     catalog = {}
     
     # Load Stock Data
     if STOCK_DIR.exists():
         for p in STOCK_DIR.iterdir():
-            if p.suffix.lower() == ".csv":
-                catalog[p.stem] = p
+            if p.suffix.lower() in DATASET_SUFFIXES:
+                catalog[p.stem] = p.with_suffix(".csv")
                 
     # Load Crypto Data
     if CRYPTO_DIR.exists():
         for p in CRYPTO_DIR.iterdir():
-            if p.suffix.lower() == ".csv":
-                catalog[p.stem] = p
+            if p.suffix.lower() in DATASET_SUFFIXES:
+                catalog[p.stem] = p.with_suffix(".csv")
 
     # Load NASDAQ Data
     if NASDAQ_DIR.exists():
         for p in NASDAQ_DIR.iterdir():
-            if p.suffix.lower() == ".csv":
-                catalog[p.stem] = p
+            if p.suffix.lower() in DATASET_SUFFIXES:
+                catalog[p.stem] = p.with_suffix(".csv")
 
-    if not catalog:
-        # If both are empty or missing, raise error
-        raise ValueError("데이터셋 폴더(stock_data, crypto_data, nasdaq_data)에 CSV 파일이 없습니다.")
-        
     return catalog
 
 
@@ -97,22 +181,22 @@ def normalize_dataset_id(dataset_id: Optional[str]) -> str:
     return target
 
 
-def _normalize_time_payload(
-    date_value: pd.Timestamp, is_crypto: bool = False
-) -> Union[int, Dict[str, int]]:
+def _normalize_time_payloads(
+    index: pd.DatetimeIndex, is_crypto: bool = False
+) -> List[Union[int, Dict[str, int]]]:
     """Normalize timestamps for chart payloads.
 
     Crypto는 24/7 데이터라 연속 unix 초를 그대로 사용하지만,
     주식(영업일만 포함)의 경우 거래일 기준 좌표를 줘야 확대 시 캔들이 밀리지 않는다.
     """
     if is_crypto:
-        return int(date_value.timestamp())
-    date_only = date_value.to_pydatetime()
-    return {
-        "year": date_only.year,
-        "month": date_only.month,
-        "day": date_only.day,
-    }
+        return index.as_unit("s").asi8.tolist()
+    return [
+        {"year": year, "month": month, "day": day}
+        for year, month, day in zip(
+            index.year.tolist(), index.month.tolist(), index.day.tolist()
+        )
+    ]
 
 
 def is_crypto_dataset(dataset_id: str) -> bool:
@@ -132,15 +216,61 @@ def is_crypto_dataset(dataset_id: str) -> bool:
     return any(k in upper_id for k in keywords)
 
 
-@lru_cache(maxsize=None)
-def get_price_data(dataset_id: str) -> pd.DataFrame:
-    catalog = get_dataset_catalog()
-    csv_path = catalog.get(dataset_id)
+# 데이터셋별 메모리 캐시: dataset_id -> (버전, 값). 버전은 원본 파일 경로와 mtime이라
+# 파일이 바뀌면 다음 요청에서 새로 읽고, 데이터셋당 항목 하나만 유지된다.
+DatasetVersion = Tuple[str, int]
+# 가격 프레임과 인코딩된 페이로드는 크기가 커서 개수 상한을 두고 가장 오래 안 쓴 항목부터 버린다
+# (페이로드 상한은 워밍업하는 columns 페이로드가 데이터셋 40개 정도까지 모두 남도록 잡았다)
+PRICE_CACHE_SIZE = 32
+PAYLOAD_CACHE_SIZE = 128
+_PRICE_CACHE: "OrderedDict[str, Tuple[DatasetVersion, pd.DataFrame]]" = OrderedDict()
+_SUMMARY_CACHE: Dict[str, Tuple[DatasetVersion, Dict[str, Any]]] = {}
+_LRU_GUARD = threading.Lock()
+
+
+def _lru_get(cache: OrderedDict, key: Any, version: DatasetVersion) -> Any:
+    with _LRU_GUARD:
+        entry = cache.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+
+def _lru_put(
+    cache: OrderedDict, key: Any, version: DatasetVersion, value: Any, max_size: int
+) -> None:
+    with _LRU_GUARD:
+        cache[key] = (version, value)
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _dataset_path(dataset_id: str) -> Path:
+    csv_path = get_dataset_catalog().get(dataset_id)
     if not csv_path:
         raise ValueError("선택한 데이터셋을 찾을 수 없습니다.")
-    data = load_price_data(csv_path)
+    return csv_path
+
+
+def dataset_version(dataset_id: str) -> DatasetVersion:
+    csv_path = _dataset_path(dataset_id)
+    source_mtime = _source_mtime_ns(csv_path)
+    if source_mtime is None:
+        raise ValueError("선택한 데이터셋을 찾을 수 없습니다.")
+    return str(csv_path), source_mtime
+
+
+def get_price_data(dataset_id: str) -> pd.DataFrame:
+    version = dataset_version(dataset_id)
+    cached = _lru_get(_PRICE_CACHE, dataset_id, version)
+    if cached is not None:
+        return cached
+    data = load_price_data(_dataset_path(dataset_id))
     if data.empty:
         raise ValueError("유효한 차트 데이터가 없습니다.")
+    _lru_put(_PRICE_CACHE, dataset_id, version, data, PRICE_CACHE_SIZE)
     return data
 
 
@@ -170,25 +300,106 @@ def resample_price_data(data: pd.DataFrame, interval: str) -> pd.DataFrame:
                 "volume": "sum",
             }
         )
-        .dropna(subset=["open", "high", "low", "close"])
     )
-    aggregated["volume"] = aggregated["volume"].fillna(0.0)
+    # 빈 구간은 OHLC가 함께 NaN이므로 close만 보고 거른다 (빈 구간이 없으면 복사도 생략)
+    has_close = aggregated["close"].notna()
+    if not has_close.all():
+        aggregated = aggregated[has_close]
+    # volume은 "sum"(min_count=0)이라 빈 구간도 0이므로 fillna가 필요 없다
     if aggregated.empty:
         raise ValueError("선택한 인터벌에 대한 데이터가 부족합니다.")
     return aggregated
 
 
-@lru_cache(maxsize=None)
-def _build_payload(dataset_id: str, normalized_interval: str) -> Dict[str, Any]:
+def normalize_layout(layout: str) -> str:
+    if not layout:
+        return "rows"
+    normalized = layout.lower()
+    if normalized not in CHART_LAYOUTS:
+        raise ValueError("지원하지 않는 레이아웃입니다. (가능: rows, columns)")
+    return normalized
+
+
+def _build_payload(
+    dataset_id: str, normalized_interval: str, layout: str = "rows"
+) -> Dict[str, Any]:
     base_data = get_price_data(dataset_id)
     working = resample_price_data(base_data, normalized_interval)
     is_crypto = is_crypto_dataset(dataset_id)
-    return format_chart_payload(working, is_crypto)
+    return format_chart_payload(working, is_crypto, layout)
+
+
+def _encode_json(payload: Any) -> bytes:
+    if orjson is not None:
+        # 숫자 위주의 캔들 페이로드는 orjson(Rust) 인코더가 stdlib json보다 몇 배 빠르다
+        return orjson.dumps(payload)
+    # JSONResponse.render와 같은 옵션
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """/api/candles body in identity and gzip form, each with its own ETag."""
+
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    gzip_etag: str
+
+
+# (dataset_id, interval, layout) -> (데이터셋 버전, EncodedPayload). 키별 락으로 같은 페이로드를 동시에 두 번 만들지 않는다
+_PAYLOAD_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[DatasetVersion, EncodedPayload]]" = (
+    OrderedDict()
+)
+_PAYLOAD_LOCKS: Dict[Tuple[str, str, str], threading.Lock] = {}
+_PAYLOAD_LOCKS_GUARD = threading.Lock()
+
+
+def _build_payload_bytes(
+    dataset_id: str, normalized_interval: str, layout: str = "rows"
+) -> EncodedPayload:
+    """Encoded /api/candles bodies and ETags, so cache hits skip JSON encoding and compression."""
+    key = (dataset_id, normalized_interval, layout)
+    version = dataset_version(dataset_id)
+    cached = cached_payload(key, version)
+    if cached is not None:
+        return cached
+
+    with _PAYLOAD_LOCKS_GUARD:
+        lock = _PAYLOAD_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        # 락을 기다리는 동안 다른 요청이 이미 만들었으면 그 결과를 쓴다
+        cached = cached_payload(key, version)
+        if cached is None:
+            body = _encode_json(_build_payload(dataset_id, normalized_interval, layout))
+            digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+            # 반복되는 키 이름 덕분에 gzip 압축률이 높다. 요청마다가 아니라 한 번만 압축해 둔다
+            cached = EncodedPayload(
+                body=body,
+                etag=f'"{digest}"',
+                gzip_body=gzip.compress(body, compresslevel=6, mtime=0),
+                gzip_etag=f'"{digest}-gzip"',
+            )
+            _lru_put(_PAYLOAD_CACHE, key, version, cached, PAYLOAD_CACHE_SIZE)
+    return cached
+
+
+def cached_payload(
+    key: Tuple[str, str, str], version: DatasetVersion
+) -> Optional[EncodedPayload]:
+    """Return the encoded payload for ``key`` if it was built from ``version`` of the data."""
+    return _lru_get(_PAYLOAD_CACHE, key, version)
 
 
 def get_dataset_summary(dataset_id: str) -> Dict[str, Any]:
-    catalog = get_dataset_catalog()
-    csv_path = catalog[dataset_id]
+    version = dataset_version(dataset_id)
+    cached = _SUMMARY_CACHE.get(dataset_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    csv_path = _dataset_path(dataset_id)
     data = get_price_data(dataset_id)
     start = data.index.min()
     end = data.index.max()
@@ -202,64 +413,114 @@ def get_dataset_summary(dataset_id: str) -> Dict[str, Any]:
     else:
         category = "stock"
     
-    return {
+    summary = {
         "id": dataset_id,
         "label": dataset_id.replace("_", " "),
         "rows": len(data),
         "range": f"{start.strftime('%Y-%m-%d')} ~ {end.strftime('%Y-%m-%d')}",
         "category": category
     }
+    _SUMMARY_CACHE[dataset_id] = (version, summary)
+    return summary
+
+
+def summaries_ready() -> bool:
+    """True when every catalog dataset has an up-to-date summary in memory."""
+    for dataset_id in get_dataset_catalog():
+        cached = _SUMMARY_CACHE.get(dataset_id)
+        if cached is None or cached[0] != dataset_version(dataset_id):
+            return False
+    return True
+
+
+def _chart_columns(data: pd.DataFrame, is_crypto: bool = False) -> Dict[str, list]:
+    """Per-column chart values (times, OHLCV, volume colors, RSI/OBV/AD) as Python lists."""
+    # 리샘플 결과에서 OHLCV 컬럼을 한 번씩만 numpy로 꺼내고 지표와 페이로드가 같은 배열을 함께 쓴다
+    open_arr = data["open"].to_numpy(dtype=np.float64)
+    high_arr = data["high"].to_numpy(dtype=np.float64)
+    low_arr = data["low"].to_numpy(dtype=np.float64)
+    close_arr = data["close"].to_numpy(dtype=np.float64)
+    volume_arr = data["volume"].to_numpy(dtype=np.float64)
+    if indicator_jit.HAS_JIT and not (
+        np.isnan(close_arr).any() or np.isnan(volume_arr).any()
+    ):
+        # 결측이 없으면 행 정렬이 필요 없으므로 RSI와 OBV를 JIT 커널 한 번으로 같이 계산한다
+        rsi_arr, obv_arr = indicator_jit.rsi_obv(close_arr, volume_arr)
+    else:
+        # compute_rsi는 입력 index를 그대로 돌려주므로 위치 기반으로 바로 꺼낸다
+        rsi_arr = compute_rsi(data["close"]).to_numpy(dtype=np.float64)
+        obv_series = compute_obv(data["close"], data["volume"])
+        if not obv_series.index.equals(data.index):
+            # close/volume에 결측이 있던 경우에만 빠진 행을 앞 값으로 채워 맞춘다
+            obv_series = obv_series.reindex(data.index, method="ffill")
+        obv_arr = np.nan_to_num(obv_series.to_numpy(dtype=np.float64), nan=0.0)
+    ad_arr = np.nan_to_num(ad_line_values(high_arr, low_arr, close_arr, volume_arr), nan=0.0)
+
+    # 행 단위 iterrows 대신 컬럼을 한 번에 numpy 배열로 꺼낸 뒤 파이썬 리스트로 묶는다
+    # time 값은 한 번만 만들고 캔들/거래량/RSI/OBV/AD 시리즈가 같은 객체를 공유한다
+    times = _normalize_time_payloads(data.index, is_crypto)
+    opens = open_arr.tolist()
+    highs = high_arr.tolist()
+    lows = low_arr.tolist()
+    closes = close_arr.tolist()
+    volume_values = volume_arr.tolist()
+    # object 배열에서 고르면 두 색상 문자열 객체를 그대로 공유한다 (np.where는 행마다 새 str을 만든다)
+    colors = VOLUME_COLORS[(close_arr >= open_arr).view(np.uint8)].tolist()
+    rsi_values = rsi_arr.tolist()
+    obv_values = obv_arr.tolist()
+    ad_values = ad_arr.tolist()
 
+    return {
+        "times": times,
+        "open": opens,
+        "high": highs,
+        "low": lows,
+        "close": closes,
+        "volume": volume_values,
+        "vol_color": colors,
+        "rsi": rsi_values,
+        "obv": obv_values,
+        "ad": ad_values,
+    }
 
-def format_chart_payload(data: pd.DataFrame, is_crypto: bool = False) -> Dict[str, Any]:
-    candles: List[Dict] = []
-    volumes: List[Dict] = []
-    rsi_points: List[Dict] = []
-    obv_points: List[Dict] = []
-    ad_points: List[Dict] = []
-    rsi_series = compute_rsi(data["close"])
-    obv_series = (
-        compute_obv(data["close"], data["volume"])
-        .reindex(data.index, method="ffill")
-        .fillna(0.0)
-    )
-    ad_series = (
-        compute_ad(data)
-        .reindex(data.index, method="ffill")
-        .fillna(0.0)
-    )
 
-    for timestamp, row in data.iterrows():
-        time_payload = _normalize_time_payload(timestamp, is_crypto)
-        candle = {
-            "time": time_payload,
-            "open": float(row["open"]),
-            "high": float(row["high"]),
-            "low": float(row["low"]),
-            "close": float(row["close"]),
-        }
-        candles.append(candle)
-        volumes.append(
-            {
-                "time": time_payload,
-                "value": float(row["volume"]),
-                "color": UP_VOLUME_COLOR
-                if row["close"] >= row["open"]
-                else DOWN_VOLUME_COLOR,
-            }
-        )
-        rsi_points.append(
-            {"time": time_payload, "value": float(rsi_series.loc[timestamp])}
-        )
-        obv_points.append(
-            {"time": time_payload, "value": float(obv_series.loc[timestamp])}
-        )
-        ad_points.append(
-            {"time": time_payload, "value": float(ad_series.loc[timestamp])}
+def format_chart_payload(
+    data: pd.DataFrame, is_crypto: bool = False, layout: str = "rows"
+) -> Dict[str, Any]:
+    """Build the /api/candles payload.
+
+    ``layout="rows"`` returns one dict per point for each series (the original
+    shape); ``layout="columns"`` returns the shared ``times`` array plus one
+    list per value, which avoids repeating keys for every point.
+    """
+    columns = _chart_columns(data, is_crypto)
+    chart_type = "crypto" if is_crypto else "stock"
+    if layout == "columns":
+        return {"type": chart_type, **columns}
+
+    times = columns["times"]
+    candles = [
+        {"time": time, "open": o, "high": h, "low": l, "close": c}
+        for time, o, h, l, c in zip(
+            times, columns["open"], columns["high"], columns["low"], columns["close"]
         )
+    ]
+    volumes = [
+        {"time": time, "value": value, "color": color}
+        for time, value, color in zip(times, columns["volume"], columns["vol_color"])
+    ]
+    rsi_points = [
+        {"time": time, "value": value} for time, value in zip(times, columns["rsi"])
+    ]
+    obv_points = [
+        {"time": time, "value": value} for time, value in zip(times, columns["obv"])
+    ]
+    ad_points = [
+        {"time": time, "value": value} for time, value in zip(times, columns["ad"])
+    ]
 
     return {
-        "type": "crypto" if is_crypto else "stock",
+        "type": chart_type,
         "candles": candles,
         "volumes": volumes,
         "rsi": rsi_points,
@@ -268,47 +529,113 @@ def format_chart_payload(data: pd.DataFrame, is_crypto: bool = False) -> Dict[st
     }
 
 
-app = FastAPI(title="ETH/USDT Candlestick Chart")
+def _warm_dataset(dataset_id: str) -> None:
+    """Populate the summary and every interval's payload cache for one dataset."""
+    try:
+        get_dataset_summary(dataset_id)
+        # 내장 UI는 columns 레이아웃만 요청하므로 rows 페이로드는 요청이 올 때 만든다
+        for interval in ALLOWED_INTERVAL_RULES:
+            _build_payload_bytes(dataset_id, interval, "columns")
+    except (ValueError, KeyError) as exc:
+        # KeyError: OHLCV 컬럼이 없는 CSV(예: CVD 내보내기)가 데이터 폴더에 섞여 있는 경우
+        print(f"Skipping cache warm-up for {dataset_id}: {exc}")
+
+
+async def _warm_caches() -> None:
+    try:
+        catalog = get_dataset_catalog()
+    except ValueError:
+        return
+    loop = asyncio.get_running_loop()
+    # 지표 JIT 커널을 먼저 컴파일해 두어 워밍업/첫 요청이 컴파일 시간을 기다리지 않게 한다
+    await loop.run_in_executor(None, indicator_jit.warm_up)
+    # 데이터셋 단위로 나눠 스레드풀에서 만든다 (같은 데이터셋의 인터벌끼리는 원본 프레임을 공유)
+    await asyncio.gather(
+        *(loop.run_in_executor(None, _warm_dataset, dataset_id) for dataset_id in catalog)
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 첫 요청이 CSV 파싱/리샘플/직렬화를 기다리지 않도록 기동 직후 백그라운드에서 캐시를 채운다
+    warm_up = asyncio.create_task(_warm_caches())
+    yield
+    warm_up.cancel()
+
+
+app = FastAPI(title="ETH/USDT Candlestick Chart", lifespan=lifespan)
+# /api/candles는 미리 압축한 본문을 직접 보내고(Content-Encoding 설정 시 미들웨어는 통과),
+# 나머지 응답(HTML, /api/datasets)은 미들웨어가 압축한다
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 @app.get("/api/candles")
-def read_candles(
+async def read_candles(
+    request: Request,
     interval: str = "1d",
     dataset: Optional[str] = None,
-) -> Dict[str, Any]:
+    layout: str = "rows",
+) -> Response:
     try:
         normalized_interval = normalize_interval(interval)
         dataset_id = normalize_dataset_id(dataset)
+        normalized_layout = normalize_layout(layout)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    # 캐시 적중(파일 stat 몇 번)은 이벤트 루프에서 바로 응답하고, 미스일 때만 pandas 빌드를 스레드로 넘긴다
     try:
-        payload = _build_payload(dataset_id, normalized_interval)
-        return payload
+        version = dataset_version(dataset_id)
     except ValueError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    encoded = cached_payload((dataset_id, normalized_interval, normalized_layout), version)
+    if encoded is None:
+        try:
+            encoded = await asyncio.to_thread(
+                _build_payload_bytes, dataset_id, normalized_interval, normalized_layout
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body, etag = encoded.gzip_body, encoded.gzip_etag
+        headers = {"ETag": etag, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+    else:
+        body, etag = encoded.body, encoded.etag
+        headers = {"ETag": etag, "Vary": "Accept-Encoding"}
 
+    # 클라이언트가 같은 ETag를 갖고 있으면 본문 없이 304로 응답한다
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
-@app.get("/api/datasets")
-def list_datasets() -> List[Dict[str, Any]]:
-    try:
-        catalog = get_dataset_catalog()
-    except ValueError as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+def _dataset_listing() -> List[Dict[str, Any]]:
+    catalog = get_dataset_catalog()
     default_id = get_default_dataset_id()
     payload: List[Dict[str, Any]] = []
     for dataset_id in sorted(catalog.keys()):
-        summary = get_dataset_summary(dataset_id)
+        # 캐시된 요약을 건드리지 않도록 복사본에 default 플래그를 붙인다
+        summary = dict(get_dataset_summary(dataset_id))
         summary["default"] = dataset_id == default_id
         payload.append(summary)
     return payload
 
 
-@app.get("/", response_class=HTMLResponse)
-def index() -> str:
-    """Serve a lightweight single-page chart UI."""
-    template = """
+@app.get("/api/datasets")
+async def list_datasets() -> List[Dict[str, Any]]:
+    # 워밍업 뒤에는 요약이 모두 메모리에 있어 루프에서 바로 만들고,
+    # 하나라도 비었거나 오래됐으면 CSV를 읽어야 하므로 이벤트 루프 밖에서 만든다
+    try:
+        if summaries_ready():
+            return _dataset_listing()
+        return await asyncio.to_thread(_dataset_listing)
+    except ValueError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+# Single-page chart UI; the color placeholders are filled once below, not per request
+INDEX_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -1745,6 +2072,31 @@ def index() -> str:
             return null;
         };
 
+        // /api/candles?layout=columns 응답(공유 times + 값 배열)을 시리즈별 포인트 배열로 펼친다
+        const expandColumnarPayload = (payload) => {
+            if (!Array.isArray(payload.times)) return payload;
+            const { times } = payload;
+            const pointsFor = (values) => times.map((time, i) => ({ time, value: values[i] }));
+            return {
+                type: payload.type,
+                candles: times.map((time, i) => ({
+                    time,
+                    open: payload.open[i],
+                    high: payload.high[i],
+                    low: payload.low[i],
+                    close: payload.close[i],
+                })),
+                volumes: times.map((time, i) => ({
+                    time,
+                    value: payload.volume[i],
+                    color: payload.vol_color[i],
+                })),
+                rsi: pointsFor(payload.rsi),
+                obv: pointsFor(payload.obv),
+                ad: pointsFor(payload.ad),
+            };
+        };
+
         const buildDataMap = (series) => {
             const map = new Map();
             series.forEach((point) => {
@@ -2002,6 +2354,7 @@ def index() -> str:
                 const url = new URL("/api/candles", window.location.origin);
                 url.searchParams.set("interval", interval);
                 url.searchParams.set("dataset", dataset);
+                url.searchParams.set("layout", "columns");
                 const response = await fetch(url);
                 if (!response.ok) {
                     let message = "차트 데이터를 불러오지 못했습니다.";
@@ -2013,7 +2366,7 @@ def index() -> str:
                     }
                     throw new Error(message);
                 }
-                const data = await response.json();
+                const data = expandColumnarPayload(await response.json());
                 if (token !== requestCounter) return;
 
                 if (data.type && data.type !== currentChartType) {
@@ -2628,15 +2981,22 @@ def index() -> str:
 </body>
 </html>
         """
-    return (
-        template.replace("%(up)s", UP_COLOR)
-        .replace("%(down)s", DOWN_COLOR)
-        .replace("%(rsi)s", RSI_COLOR)
-        .replace("%(obv)s", OBV_COLOR)
-    )
+_INDEX_HTML = (
+    INDEX_TEMPLATE.replace("%(up)s", UP_COLOR)
+    .replace("%(down)s", DOWN_COLOR)
+    .replace("%(rsi)s", RSI_COLOR)
+    .replace("%(obv)s", OBV_COLOR)
+).encode("utf-8")
+
+
+@app.get("/", response_class=HTMLResponse)
+def index() -> HTMLResponse:
+    """Serve a lightweight single-page chart UI."""
+    return HTMLResponse(_INDEX_HTML)
 
 
 def main() -> None:
+    # loop/http 기본값("auto")은 uvicorn[standard]로 설치된 uvloop/httptools를 골라 쓴다
     uvicorn.run(
         "main:app",
         host="127.0.0.1",
@@ -0,0 +1,84 @@
+"""Shared readers/writers for the OHLCV/CVD export scripts.
+
+CSV는 FastAPI 앱(main.py)과 기존 다운스트림 도구가 읽는 형식 그대로
+``DataFrame.to_csv``로 쓴다 (Arrow CSV writer는 따옴표/날짜 표기가 달라진다).
+같은 이름의 ``.parquet`` 파일을 함께 남겨 두면 읽는 쪽은 CSV 파싱 없이
+컬럼 단위로 바로 로드할 수 있다. CSV는 사람이 열어 보는 용도로 유지한다.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+__all__ = ["load_ohlcv", "read_ohlcv_csv", "write_csv", "write_parquet"]
+
+# 파일 핸들 버퍼를 크게 잡아 write() 시스템 콜 수를 줄인다.
+CSV_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Arrow CSV 리더에 넘기는 OHLCV 스키마 (타입 추론 패스를 생략한다)
+OHLCV_CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types={
+        "date": pa.timestamp("ns"),
+        "open": pa.float64(),
+        "high": pa.float64(),
+        "low": pa.float64(),
+        "close": pa.float64(),
+        "volume": pa.float64(),
+    },
+    null_values=["", "NA", "NaN"],
+)
+
+# CSV 대신 읽을 수 있는 컬럼 포맷 사이드카 (우선순위 순)
+COLUMNAR_READERS = {
+    ".parquet": pd.read_parquet,
+    ".feather": pd.read_feather,
+}
+
+
+def write_csv(frame: pd.DataFrame, path: Path) -> None:
+    """Write ``frame`` (without its index) to ``path`` as CSV.
+
+    Output is byte-identical to ``frame.to_csv(path, index=False)``: minimal
+    quoting, and date-only timestamps stay ``YYYY-MM-DD``.
+    """
+    with open(path, "w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER_SIZE) as handle:
+        frame.to_csv(handle, index=False)
+
+
+def write_parquet(frame: pd.DataFrame, path: Path) -> Path:
+    """Write ``frame`` next to ``path`` as ZSTD-compressed Parquet."""
+    parquet_path = Path(path).with_suffix(".parquet")
+    frame.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=False)
+    return parquet_path
+
+
+def load_ohlcv(path: Path) -> pd.DataFrame:
+    """Load an exported dataset, preferring a fresh Parquet/Feather sidecar.
+
+    A sidecar is only used when it is at least as new as the CSV, so CSVs
+    edited in place (e.g. by ``stock_update``) are never shadowed by stale
+    columnar files.
+    """
+    csv_path = Path(path)
+    for suffix, reader in COLUMNAR_READERS.items():
+        columnar_path = csv_path.with_suffix(suffix)
+        if columnar_path.exists() and (
+            not csv_path.exists()
+            or columnar_path.stat().st_mtime >= csv_path.stat().st_mtime
+        ):
+            return reader(columnar_path)
+    return read_ohlcv_csv(csv_path)
+
+
+def read_ohlcv_csv(csv_path: Path) -> pd.DataFrame:
+    """Parse an OHLCV CSV with Arrow's multithreaded reader and a fixed schema."""
+    try:
+        table = pacsv.read_csv(csv_path, convert_options=OHLCV_CSV_CONVERT_OPTIONS)
+    except pa.ArrowInvalid:
+        # 숫자/날짜가 아닌 값이 섞인 파일은 pandas로 읽고 호출 측의 to_numeric 정리에 맡긴다
+        return pd.read_csv(csv_path, parse_dates=["date"])
+    return table.to_pandas(self_destruct=True)
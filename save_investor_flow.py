@@ -11,6 +11,7 @@ presence of weekends/holidays.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import sys
 from datetime import datetime, timedelta
@@ -106,6 +107,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         todate=to_date,
         ticker=args.ticker,
     )
+    # MCP 툴은 async로 선언되어 있으므로 (이벤트 루프 밖에서) 직접 실행한다
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
     if "error" in result:
         raise RuntimeError(result["error"])
 
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import sys
@@ -47,7 +48,11 @@ COLUMN_ALIASES: Dict[str, Iterable[str]] = {
 def _default_fetcher(*, start: str, end: str, ticker: str, adjusted: bool = True) -> Dict[str, Any]:
     if get_stock_ohlcv is None:
         raise RuntimeError("kospi_kosdaq_stock_server 모듈을 찾을 수 없습니다.")
-    return get_stock_ohlcv(start, end, ticker, adjusted=adjusted)
+    result = get_stock_ohlcv(start, end, ticker, adjusted=adjusted)
+    # MCP 툴은 async로 선언되어 있으므로 (이벤트 루프 밖에서) 직접 실행한다
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
 
 
 @dataclass
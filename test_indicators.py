@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+import indicator.ad as ad_module
+from indicator.ad import compute_ad
+
+
+def _reference_ad(data: pd.DataFrame) -> pd.Series:
+    # Original pandas implementation: fillna(0) on CLV, then a skipna cumsum
+    high, low, close, volume = data["high"], data["low"], data["close"], data["volume"]
+    clv = (((close - low) - (high - close)) / (high - low)).fillna(0.0)
+    return (clv * volume).cumsum()
+
+
+def _frame_with_missing_rows() -> pd.DataFrame:
+    data = pd.DataFrame(
+        {
+            "high": [11.0, 12.0, np.nan, 13.0, 14.0, 15.0],
+            "low": [9.0, 10.0, 10.0, 11.0, 14.0, 12.0],
+            "close": [10.5, 11.5, 11.5, np.nan, 14.0, 14.5],
+            "volume": [100.0, 200.0, 300.0, 400.0, 500.0, np.nan],
+        },
+        index=pd.date_range("2024-01-01", periods=6, freq="D"),
+    )
+    # Append a clean row after the missing volume so it must keep accumulating
+    data.loc[pd.Timestamp("2024-01-07")] = [16.0, 14.0, 15.5, 600.0]
+    return data
+
+
+def test_ad_nan_row_does_not_poison_later_values():
+    data = _frame_with_missing_rows()
+    original_ne = ad_module.ne
+    try:
+        for ne in (original_ne, None):
+            ad_module.ne = ne
+            result = compute_ad(data)
+            expected = _reference_ad(data)
+            assert result.index.equals(data.index)
+            np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+            assert np.isnan(result.iloc[5])
+            assert np.isfinite(result.iloc[6])
+    finally:
+        ad_module.ne = original_ne
+
+
+if __name__ == "__main__":
+    test_ad_nan_row_does_not_poison_later_values()
+    print("ok")
@@ -0,0 +1,53 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ohlcv_io import write_csv
+
+
+def _written_text(frame: pd.DataFrame) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.csv"
+        write_csv(frame, path)
+        return path.read_bytes().decode("utf-8")
+
+
+def test_write_csv_daily_export_text():
+    # Daily NASDAQ/CVD exports: date-only timestamps, floats, a missing value
+    frame = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+            "open": [185.0, 184.25],
+            "close": [185.64, np.nan],
+            "volume": [82488700, 58414500],
+            "note": ["split, adjusted", "plain"],
+        }
+    )
+    assert _written_text(frame) == (
+        "date,open,close,volume,note\n"
+        '2024-01-02,185.0,185.64,82488700,"split, adjusted"\n'
+        "2024-01-03,184.25,,58414500,plain\n"
+    )
+    assert _written_text(frame) == frame.to_csv(index=False)
+
+
+def test_write_csv_intraday_export_text():
+    frame = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-02 09:30:00", "2024-01-02 09:31:00"]),
+            "close": [1.5, 2.0],
+        }
+    )
+    assert _written_text(frame) == (
+        "date,close\n"
+        "2024-01-02 09:30:00,1.5\n"
+        "2024-01-02 09:31:00,2.0\n"
+    )
+
+
+if __name__ == "__main__":
+    test_write_csv_daily_export_text()
+    test_write_csv_intraday_export_text()
+    print("ok")
@@ -0,0 +1,60 @@
+"""On-disk Parquet cache for yfinance downloads.
+
+Yahoo 요청은 호출마다 수 초가 걸리므로 (ticker, 기간, 인터벌) 조합별로
+정리된 OHLCV 프레임을 ``nasdaq_data/_cache`` 아래 Parquet 파일로 저장해 두고,
+TTL 안에서는 네트워크 대신 캐시 파일을 읽는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+CACHE_DIR = Path(__file__).with_name("nasdaq_data") / "_cache"
+DAILY_TTL = timedelta(hours=6)
+INTRADAY_TTL = timedelta(minutes=15)
+
+
+def is_intraday(interval: str) -> bool:
+    return interval.endswith(("m", "h")) and not interval.endswith("mo")
+
+
+def cache_path(
+    ticker: str,
+    interval: str,
+    period: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Path:
+    """Return the cache file path for a download request."""
+    raw_key = f"{ticker}|{start}|{end}|{period}|{interval}"
+    key = hashlib.sha1(raw_key.encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / f"{key}.parquet"
+
+
+def load_cached_frame(path: Path, interval: str) -> Optional[pd.DataFrame]:
+    """Read a cached frame if it exists and is still within its TTL."""
+    if not path.exists():
+        return None
+    ttl = INTRADAY_TTL if is_intraday(interval) else DAILY_TTL
+    if time.time() - path.stat().st_mtime > ttl.total_seconds():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as exc:
+        print(f"Ignoring unreadable cache {path}: {exc}")
+        return None
+
+
+def store_cached_frame(path: Path, frame: pd.DataFrame) -> None:
+    """Persist a downloaded frame; failures only cost the next cache hit."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frame.to_parquet(path, engine="pyarrow", compression="zstd")
+    except Exception as exc:
+        print(f"Failed to write cache {path}: {exc}")